@@ -1,12 +1,160 @@
 """
 Модуль диалогов для управления актерами в приложении "Театральный менеджер".
 """
+from collections import namedtuple
+
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QFormLayout,
-                              QPushButton, QComboBox, QSpinBox, QTableWidget,
-                              QTableWidgetItem, QHeaderView, QMessageBox)
-from PySide6.QtCore import Qt
+                              QPushButton, QComboBox, QSpinBox, QTableView,
+                              QAbstractItemView, QHeaderView, QMessageBox)
+from PySide6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+                            QObject, QRunnable, QThreadPool, Signal)
+
+from controller import TheaterController, ValidatedLineEdit, RANK_ORDER, RANK_INDEX
+
+# Заголовки столбцов таблицы актеров
+ACTORS_HEADERS = ("ID", "Фамилия", "Имя", "Отчество", "Звание", "Опыт", "Награды")
+
+# Запись актера; порядок полей совпадает с порядком столбцов таблицы
+Actor = namedtuple('Actor', 'actor_id last_name first_name patronymic rank experience awards_count')
+_RANK_COLUMN = Actor._fields.index('rank')
+
+# Кнопки диалога подтверждения
+_YES_NO = QMessageBox.Yes | QMessageBox.No
+
+
+class ActorsFetchSignals(QObject):
+    """Сигналы фоновой загрузки списка актеров."""
+    # Задача-источник и список актеров (None при ошибке запроса)
+    finished = Signal(object, object)
+
+
+class ActorsFetchWorker(QRunnable):
+    """
+    Задача пула потоков для загрузки списка актеров из базы данных.
+    Запрос выполняется через отдельное соединение, кэш контроллера не затрагивается.
+    Результат передается в главный поток через сигнал finished (queued-соединение).
+    """
+
+    def __init__(self, controller):
+        super().__init__()
+        self.controller = controller
+        self.signals = ActorsFetchSignals()
+
+    def run(self):
+        """Выполнение запроса в рабочем потоке."""
+        rows = self.controller.fetch_actors_detached()
+        actors = None if rows is None else [_to_actor(row) for row in rows]
+        self.signals.finished.emit(self, actors)
+
+
+def _to_actor(row):
+    """Преобразование строки результата запроса в запись Actor."""
+    return Actor._make(row[field] for field in Actor._fields)
+
+
+def _warn(parent, message):
+    """Показ предупреждения с заголовком «Ошибка»."""
+    QMessageBox.warning(parent, "Ошибка", message)
+
+
+class ActorsTableModel(QAbstractTableModel):
+    """
+    Модель таблицы актеров для QTableView.
+    Отдает данные ячеек по запросу представления, не создавая элементов для каждой ячейки.
+    Строки становятся видны представлению порциями: следующая порция подгружается
+    через fetchMore, когда таблицу прокручивают до конца.
+    """
+    # Количество строк, открываемых представлению за одну подгрузку
+    FETCH_CHUNK_SIZE = 200
+
+    def __init__(self, actors=None, parent=None):
+        super().__init__(parent)
+        self._actors = list(actors) if actors else []
+        # Количество строк, уже доступных представлению
+        self._loaded = min(len(self._actors), self.FETCH_CHUNK_SIZE)
+
+    def set_actors(self, actors):
+        """Замена списка актеров с полным сбросом модели; видна только первая порция."""
+        self.beginResetModel()
+        self._actors = list(actors)
+        self._loaded = min(len(self._actors), self.FETCH_CHUNK_SIZE)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._actors)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        self._load_up_to(self._loaded + self.FETCH_CHUNK_SIZE)
+
+    def fetch_all(self):
+        """Открытие представлению всех оставшихся строк (например, перед сортировкой)."""
+        self._load_up_to(len(self._actors))
+
+    def _load_up_to(self, end):
+        """Открытие представлению строк до позиции end."""
+        end = min(end, len(self._actors))
+        if end <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+        self._loaded = end
+        self.endInsertRows()
+
+    def append_actor(self, actor):
+        """Добавление актера в конец модели."""
+        if self._loaded < len(self._actors):
+            # Строка станет видна с очередной порцией
+            self._actors.append(actor)
+            return
+        row = len(self._actors)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._actors.append(actor)
+        self._loaded += 1
+        self.endInsertRows()
+
+    def update_actor(self, row, actor):
+        """Замена данных актера в строке с обновлением только ее ячеек."""
+        self._actors[row] = actor
+        if row < self._loaded:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(Actor._fields) - 1))
+
+    def remove_actor(self, row):
+        """Удаление строки актера из модели."""
+        if row >= self._loaded:
+            del self._actors[row]
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._actors[row]
+        self._loaded -= 1
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(Actor._fields)
 
-from controller import TheaterController, NumericTableItem, RankTableItem, ValidatedLineEdit
+    def data(self, index, role=Qt.DisplayRole):
+        """Значение ячейки: строка для отображения, исходное значение для сортировки."""
+        if not index.isValid():
+            return None
+
+        value = self._actors[index.row()][index.column()]
+
+        if role == Qt.DisplayRole:
+            return str(value)
+        if role in (Qt.EditRole, Qt.UserRole):
+            # Звания сортируются по порядку, а не по алфавиту
+            if index.column() == _RANK_COLUMN:
+                return RANK_INDEX.get(value, -1)
+            return value
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return ACTORS_HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class EditActorDialog(QDialog):
@@ -23,61 +171,51 @@ class EditActorDialog(QDialog):
         self.setMinimumWidth(400)
 
         self.setup_ui()
+        self.load_actor(actor)
 
     def setup_ui(self):
         """Настройка пользовательского интерфейса диалога."""
         layout = QFormLayout(self)
 
-        # Стиль для меток
-        label_style = "color: #333333; font-weight: bold;"
-
         # Поля для ввода данных актера
         # Фамилия
         last_name_label = QLabel("Фамилия:")
-        last_name_label.setStyleSheet(label_style)
-        self.last_name_edit = ValidatedLineEdit(self.controller, self.actor['last_name'])
+        last_name_label.setProperty("class", "fieldLabel")
+        self.last_name_edit = ValidatedLineEdit(self.controller)
         layout.addRow(last_name_label, self.last_name_edit)
 
         # Имя
         first_name_label = QLabel("Имя:")
-        first_name_label.setStyleSheet(label_style)
-        self.first_name_edit = ValidatedLineEdit(self.controller, self.actor['first_name'])
+        first_name_label.setProperty("class", "fieldLabel")
+        self.first_name_edit = ValidatedLineEdit(self.controller)
         layout.addRow(first_name_label, self.first_name_edit)
 
         # Отчество
         patronymic_label = QLabel("Отчество:")
-        patronymic_label.setStyleSheet(label_style)
-        self.patronymic_edit = ValidatedLineEdit(self.controller, self.actor['patronymic'])
+        patronymic_label.setProperty("class", "fieldLabel")
+        self.patronymic_edit = ValidatedLineEdit(self.controller)
         layout.addRow(patronymic_label, self.patronymic_edit)
 
         # Звание
         rank_label = QLabel("Звание:")
-        rank_label.setStyleSheet(label_style)
+        rank_label.setProperty("class", "fieldLabel")
         self.rank_combo = QComboBox()
         self.rank_combo.setMinimumWidth(145)
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
-        for rank in rank_order:
-            self.rank_combo.addItem(rank)
-        # Установка текущего звания
-        index = self.rank_combo.findText(self.actor['rank'])
-        if index >= 0:
-            self.rank_combo.setCurrentIndex(index)
+        self.rank_combo.addItems(RANK_ORDER)
         layout.addRow(rank_label, self.rank_combo)
 
         # Количество наград
         awards_label = QLabel("Количество наград:")
-        awards_label.setStyleSheet(label_style)
+        awards_label.setProperty("class", "fieldLabel")
         self.awards_spin = QSpinBox()
         self.awards_spin.setRange(0, 65)
-        self.awards_spin.setValue(self.actor['awards_count'])
         layout.addRow(awards_label, self.awards_spin)
 
         # Опыт работы
         exp_label = QLabel("Опыт (лет):")
-        exp_label.setStyleSheet(label_style)
+        exp_label.setProperty("class", "fieldLabel")
         self.exp_spin = QSpinBox()
         self.exp_spin.setRange(0, 65)
-        self.exp_spin.setValue(self.actor['experience'])
         layout.addRow(exp_label, self.exp_spin)
 
         # Кнопки действий
@@ -93,15 +231,37 @@ class EditActorDialog(QDialog):
 
         layout.addRow("", buttons_layout)
 
+    def load_actor(self, actor):
+        """
+        Заполнение полей диалога данными актера.
+        Позволяет повторно использовать один экземпляр диалога для разных актеров.
+        """
+        self.actor = actor
+        self.last_name_edit.setText(actor.last_name)
+        self.first_name_edit.setText(actor.first_name)
+        self.patronymic_edit.setText(actor.patronymic)
+        # Установка текущего звания
+        index = RANK_INDEX.get(actor.rank, -1)
+        if index >= 0:
+            self.rank_combo.setCurrentIndex(index)
+        self.awards_spin.setValue(actor.awards_count)
+        self.exp_spin.setValue(actor.experience)
+        self.last_name_edit.setFocus()
+
     def validate_and_accept(self):
         """Валидация введенных данных и закрытие диалога с принятием."""
+        # Очищенные значения сохраняются для чтения родительским диалогом
+        self.last_name = self.last_name_edit.text().strip()
+        self.first_name = self.first_name_edit.text().strip()
+        self.patronymic = self.patronymic_edit.text().strip()
+
         # Проверка заполнения обязательных полей
-        if not self.last_name_edit.text().strip():
-            QMessageBox.warning(self, "Ошибка", "Введите фамилию")
+        if not self.last_name:
+            _warn(self, "Введите фамилию")
             return
 
-        if not self.first_name_edit.text().strip():
-            QMessageBox.warning(self, "Ошибка", "Введите имя")
+        if not self.first_name:
+            _warn(self, "Введите имя")
             return
 
         # Если все проверки пройдены, принимаем диалог
@@ -116,12 +276,15 @@ class ActorsManagementDialog(QDialog):
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
-        self.all_actors = controller.get_all_actors()
+        # Диалоги добавления и редактирования создаются при первом использовании
+        self._add_dialog = None
+        self._edit_dialog = None
 
         self.setWindowTitle("Актёры")
         self.setMinimumSize(800, 600)
 
         self.setup_ui()
+        self.reset()
 
     def setup_ui(self):
         """Настройка пользовательского интерфейса диалога."""
@@ -132,33 +295,51 @@ class ActorsManagementDialog(QDialog):
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
 
+        # Модель актеров и прокси для сортировки по исходным значениям
+        self.actors_model = ActorsTableModel(parent=self)
+        self.actors_proxy = QSortFilterProxyModel(self)
+        self.actors_proxy.setSourceModel(self.actors_model)
+        self.actors_proxy.setSortRole(Qt.UserRole)
+
         # Таблица актеров
-        self.actors_table = QTableWidget()
-        self.actors_table.setColumnCount(7)
-        self.actors_table.setHorizontalHeaderLabels(
-            ["ID", "Фамилия", "Имя", "Отчество", "Звание", "Опыт", "Награды"])
+        self.actors_table = QTableView()
+        self.actors_table.setModel(self.actors_proxy)
         self.actors_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.actors_table.setEditTriggers(QTableWidget.NoEditTriggers)
-
-        # Заполнение таблицы данными
-        self.update_actors_table()
-
-        # Включение сортировки и обработки двойного клика
+        # Фиксированная высота строк: при добавлении строк их размеры не пересчитываются
+        self.actors_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.actors_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Выделение строками: выбранный актер определяется по одному индексу на строку
+        self.actors_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Плавная прокрутка: следующая порция строк подгружается при достижении конца таблицы
+        self.actors_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        # Включение сортировки и обработки двойного клика.
+        # Сортировка по столбцу требует всех строк, поэтому перед ней подгружаются оставшиеся
+        self.actors_table.horizontalHeader().sortIndicatorChanged.connect(self._load_all_for_sort)
         self.actors_table.setSortingEnabled(True)
-        self.actors_table.cellDoubleClicked.connect(self.edit_actor)
+        # Начальная сортировка совпадает с порядком загрузки, чтобы строки можно было подгружать порциями
+        self.actors_table.sortByColumn(0, Qt.AscendingOrder)
+        self.actors_table.doubleClicked.connect(self.edit_actor)
 
         layout.addWidget(self.actors_table)
 
+        # Надпись на время загрузки данных
+        self.loading_label = QLabel("Загрузка...")
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.loading_label)
+
         # Кнопки действий
         buttons_layout = QHBoxLayout()
 
-        add_actor_btn = QPushButton("Добавить актера")
-        add_actor_btn.clicked.connect(self.add_actor)
-        buttons_layout.addWidget(add_actor_btn)
+        # Кнопки изменения данных недоступны до завершения загрузки:
+        # контроллер использует одно соединение с базой данных
+        self.add_actor_btn = QPushButton("Добавить актера")
+        self.add_actor_btn.clicked.connect(self.add_actor)
+        buttons_layout.addWidget(self.add_actor_btn)
 
-        delete_actor_btn = QPushButton("Удалить актера")
-        delete_actor_btn.clicked.connect(self.delete_actor)
-        buttons_layout.addWidget(delete_actor_btn)
+        self.delete_actor_btn = QPushButton("Удалить актера")
+        self.delete_actor_btn.clicked.connect(self.delete_actor)
+        buttons_layout.addWidget(self.delete_actor_btn)
 
         close_btn = QPushButton("Закрыть")
         close_btn.clicked.connect(self.accept)
@@ -166,74 +347,123 @@ class ActorsManagementDialog(QDialog):
 
         layout.addLayout(buttons_layout)
 
-    def update_actors_table(self):
-        """Обновление содержимого таблицы актеров."""
-        # Получение актуального списка актеров
-        self.all_actors = self.controller.get_all_actors()
-        self.actors_table.setRowCount(len(self.all_actors))
-
-        # Временно отключаем сортировку для заполнения таблицы
-        self.actors_table.setSortingEnabled(False)
-
-        # Заполнение таблицы данными
-        for i, actor in enumerate(self.all_actors):
-            id_item = NumericTableItem(str(actor['actor_id']), actor['actor_id'])
-            last_name_item = QTableWidgetItem(actor['last_name'])
-            first_name_item = QTableWidgetItem(actor['first_name'])
-            patronymic_item = QTableWidgetItem(actor['patronymic'])
-            rank_item = RankTableItem(actor['rank'])
-            exp_item = NumericTableItem(str(actor['experience']), actor['experience'])
-            awards_item = NumericTableItem(str(actor['awards_count']), actor['awards_count'])
-
-            self.actors_table.setItem(i, 0, id_item)
-            self.actors_table.setItem(i, 1, last_name_item)
-            self.actors_table.setItem(i, 2, first_name_item)
-            self.actors_table.setItem(i, 3, patronymic_item)
-            self.actors_table.setItem(i, 4, rank_item)
-            self.actors_table.setItem(i, 5, exp_item)
-            self.actors_table.setItem(i, 6, awards_item)
-
-        # Включаем сортировку обратно
-        self.actors_table.setSortingEnabled(True)
+    def reset(self):
+        """
+        Заполнение таблицы актеров: из кэша контроллера или фоновой загрузкой.
+        Вызывается при создании диалога и перед каждым повторным открытием.
+        """
+        # Таблица очищается до получения данных
+        self.all_actors = []
+        self._actor_by_id = {}
+        self.actors_model.set_actors([])
+
+        # Уже загруженный контроллером список показывается сразу, без запроса
+        cached = self.controller.get_cached_actors()
+        if cached is not None:
+            self._worker = None
+            self._apply_actors([_to_actor(row) for row in cached])
+            return
+
+        self.loading_label.show()
+        self.add_actor_btn.setEnabled(False)
+        self.delete_actor_btn.setEnabled(False)
+
+        # Загрузка актеров в фоне: диалог открывается сразу, таблица заполняется по готовности
+        self._worker = ActorsFetchWorker(self.controller)
+        self._worker.signals.finished.connect(self._on_actors_loaded)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _on_actors_loaded(self, worker, actors):
+        """Обработка результата фоновой загрузки актеров."""
+        # Результат устаревшей загрузки (reset() был вызван повторно) отбрасывается
+        if worker is not self._worker:
+            return
+        self._worker = None
+        if actors is None:
+            _warn(self, "Не удалось загрузить список актеров.")
+            actors = []
+        self._apply_actors(actors)
+
+    def _apply_actors(self, actors):
+        """Отображение загруженного списка актеров и разблокировка кнопок."""
+        self.all_actors = actors
+        self._actor_by_id = {a.actor_id: a for a in self.all_actors}
+        self.loading_label.hide()
+        self.add_actor_btn.setEnabled(True)
+        self.delete_actor_btn.setEnabled(True)
+        self._show_actors()
+
+    def _show_actors(self):
+        """
+        Передача списка актеров в модель.
+        Представление получает только первую порцию строк, остальные подгружаются при прокрутке.
+        """
+        self.actors_model.set_actors(self.all_actors)
+        # Порядок порций совпадает с порядком запроса (по ID); при другой сортировке нужны все строки
+        self._load_all_for_sort()
+
+    def _load_all_for_sort(self, *args):
+        """Подгрузка всех строк, если таблица отсортирована не в порядке загрузки."""
+        header = self.actors_table.horizontalHeader()
+        if header.sortIndicatorSection() != 0 or header.sortIndicatorOrder() != Qt.AscendingOrder:
+            self.actors_model.fetch_all()
+
+    def _source_row(self, index):
+        """Строка модели (и позиция в all_actors) для индекса отсортированной таблицы."""
+        return self.actors_proxy.mapToSource(index).row()
 
     def add_actor(self):
         """Открытие диалога добавления нового актера."""
-        dialog = AddActorDialog(self.controller, self)
+        if self._add_dialog is None:
+            self._add_dialog = AddActorDialog(self.controller, self)
+        else:
+            self._add_dialog.load_actor(None)
+        dialog = self._add_dialog
         if dialog.exec():
             # Если диалог был принят, получаем данные и добавляем актера
-            last_name = dialog.last_name_edit.text().strip()
-            first_name = dialog.first_name_edit.text().strip()
-            patronymic = dialog.patronymic_edit.text().strip()
+            last_name = dialog.last_name
+            first_name = dialog.first_name
+            patronymic = dialog.patronymic
             rank = dialog.rank_combo.currentText()
             awards_count = dialog.awards_spin.value()
             experience = dialog.exp_spin.value()
 
             # Добавление актера в БД
-            actor_id = self.controller.add_new_actor(last_name, first_name, patronymic, rank, awards_count, experience)
-
-            if actor_id:
-                # Обновление таблицы при успешном добавлении
-                self.update_actors_table()
+            actor = self.controller.add_new_actor(last_name, first_name, patronymic, rank, awards_count, experience)
+
+            if actor:
+                actor = _to_actor(actor)
+                # Добавление строки только для нового актера, без повторной загрузки списка
+                self.all_actors.append(actor)
+                self._actor_by_id[actor.actor_id] = actor
+                self.actors_model.append_actor(actor)
                 QMessageBox.information(self, "Успех", "Актер успешно добавлен.")
             else:
-                QMessageBox.warning(self, "Ошибка", "Не удалось добавить актера.")
+                _warn(self, "Не удалось добавить актера.")
 
-    def edit_actor(self, row, column):
+    def edit_actor(self, index):
         """Открытие диалога редактирования актера."""
         # Получение ID актера из таблицы
-        actor_id = int(self.actors_table.item(row, 0).text())
-        actor = next((a for a in self.all_actors if a['actor_id'] == actor_id), None)
+        actor_id = index.siblingAtColumn(0).data(Qt.UserRole)
+        actor = self._actor_by_id.get(actor_id)
 
         if not actor:
             return
 
+        # Строка модели не меняется, пока открыт диалог: порции подгружаются только в конец
+        row = self._source_row(index)
+
         # Открытие диалога редактирования
-        dialog = EditActorDialog(self.controller, actor, self)
+        if self._edit_dialog is None:
+            self._edit_dialog = EditActorDialog(self.controller, actor, self)
+        else:
+            self._edit_dialog.load_actor(actor)
+        dialog = self._edit_dialog
         if dialog.exec():
             # Если диалог был принят, получаем данные и обновляем актера
-            last_name = dialog.last_name_edit.text().strip()
-            first_name = dialog.first_name_edit.text().strip()
-            patronymic = dialog.patronymic_edit.text().strip()
+            last_name = dialog.last_name
+            first_name = dialog.first_name
+            patronymic = dialog.patronymic
             rank = dialog.rank_combo.currentText()
             awards_count = dialog.awards_spin.value()
             experience = dialog.exp_spin.value()
@@ -243,30 +473,34 @@ class ActorsManagementDialog(QDialog):
                 actor_id, last_name, first_name, patronymic, rank, awards_count, experience)
 
             if success:
-                # Обновление таблицы при успешном обновлении
-                self.update_actors_table()
+                # Обновление только строки измененного актера
+                actor = actor._replace(last_name=last_name, first_name=first_name, patronymic=patronymic,
+                                       rank=rank, awards_count=awards_count, experience=experience)
+                self.all_actors[row] = actor
+                self._actor_by_id[actor_id] = actor
+                self.actors_model.update_actor(row, actor)
                 QMessageBox.information(self, "Успех", "Актер успешно обновлен.")
             else:
-                QMessageBox.warning(self, "Ошибка", f"Не удалось обновить актера: {message}")
+                _warn(self, f"Не удалось обновить актера: {message}")
 
     def delete_actor(self):
         """Удаление выбранного актера."""
         # Проверка наличия выбранных строк
-        selected_rows = self.actors_table.selectedItems()
+        selected_rows = self.actors_table.selectionModel().selectedRows()
         if not selected_rows:
-            QMessageBox.warning(self, "Ошибка", "Выберите актера для удаления.")
+            _warn(self, "Выберите актера для удаления.")
             return
 
         # Получение ID актера
-        row = selected_rows[0].row()
-        actor_id = int(self.actors_table.item(row, 0).text())
+        actor_id = selected_rows[0].siblingAtColumn(0).data(Qt.UserRole)
+        row = self._source_row(selected_rows[0])
 
         # Запрос подтверждения
         confirm = QMessageBox.question(
             self,
             "Подтверждение",
             "Вы уверены, что хотите удалить этого актера?",
-            QMessageBox.Yes | QMessageBox.No
+            _YES_NO
         )
 
         if confirm == QMessageBox.Yes:
@@ -274,11 +508,13 @@ class ActorsManagementDialog(QDialog):
             success, message = self.controller.delete_actor_by_id(actor_id)
 
             if success:
-                # Обновление таблицы при успешном удалении
-                self.update_actors_table()
+                # Удаление только строки удаленного актера
+                del self.all_actors[row]
+                del self._actor_by_id[actor_id]
+                self.actors_model.remove_actor(row)
                 QMessageBox.information(self, "Успех", "Актер успешно удален.")
             else:
-                QMessageBox.warning(self, "Ошибка", f"Не удалось удалить актера: {message}")
+                _warn(self, f"Не удалось удалить актера: {message}")
 
 
 class AddActorDialog(QDialog):
@@ -298,47 +534,42 @@ class AddActorDialog(QDialog):
         """Настройка пользовательского интерфейса диалога."""
         layout = QFormLayout(self)
 
-        # Стиль для меток
-        label_style = "color: #333333; font-weight: bold;"
-
         # Поля для ввода данных актера
         # Фамилия
         last_name_label = QLabel("Фамилия:")
-        last_name_label.setStyleSheet(label_style)
+        last_name_label.setProperty("class", "fieldLabel")
         self.last_name_edit = ValidatedLineEdit(self.controller)
         layout.addRow(last_name_label, self.last_name_edit)
 
         # Имя
         first_name_label = QLabel("Имя:")
-        first_name_label.setStyleSheet(label_style)
+        first_name_label.setProperty("class", "fieldLabel")
         self.first_name_edit = ValidatedLineEdit(self.controller)
         layout.addRow(first_name_label, self.first_name_edit)
 
         # Отчество
         patronymic_label = QLabel("Отчество:")
-        patronymic_label.setStyleSheet(label_style)
+        patronymic_label.setProperty("class", "fieldLabel")
         self.patronymic_edit = ValidatedLineEdit(self.controller)
         layout.addRow(patronymic_label, self.patronymic_edit)
 
         # Звание
         rank_label = QLabel("Звание:")
-        rank_label.setStyleSheet(label_style)
+        rank_label.setProperty("class", "fieldLabel")
         self.rank_combo = QComboBox()
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
-        for rank in rank_order:
-            self.rank_combo.addItem(rank)
+        self.rank_combo.addItems(RANK_ORDER)
         layout.addRow(rank_label, self.rank_combo)
 
         # Количество наград
         awards_label = QLabel("Количество наград:")
-        awards_label.setStyleSheet(label_style)
+        awards_label.setProperty("class", "fieldLabel")
         self.awards_spin = QSpinBox()
         self.awards_spin.setRange(0, 20)
         layout.addRow(awards_label, self.awards_spin)
 
         # Опыт работы
         exp_label = QLabel("Опыт (лет):")
-        exp_label.setStyleSheet(label_style)
+        exp_label.setProperty("class", "fieldLabel")
         self.exp_spin = QSpinBox()
         self.exp_spin.setRange(0, 50)
         layout.addRow(exp_label, self.exp_spin)
@@ -356,15 +587,33 @@ class AddActorDialog(QDialog):
 
         layout.addRow("", buttons_layout)
 
+    def load_actor(self, actor=None):
+        """
+        Сброс полей диалога перед повторным открытием.
+        Без данных актера поля очищаются.
+        """
+        self.last_name_edit.setText(actor.last_name if actor else "")
+        self.first_name_edit.setText(actor.first_name if actor else "")
+        self.patronymic_edit.setText(actor.patronymic if actor else "")
+        self.rank_combo.setCurrentIndex(RANK_INDEX.get(actor.rank, 0) if actor else 0)
+        self.awards_spin.setValue(actor.awards_count if actor else 0)
+        self.exp_spin.setValue(actor.experience if actor else 0)
+        self.last_name_edit.setFocus()
+
     def validate_and_accept(self):
         """Валидация введенных данных и закрытие диалога с принятием."""
+        # Очищенные значения сохраняются для чтения родительским диалогом
+        self.last_name = self.last_name_edit.text().strip()
+        self.first_name = self.first_name_edit.text().strip()
+        self.patronymic = self.patronymic_edit.text().strip()
+
         # Проверка заполнения обязательных полей
-        if not self.last_name_edit.text().strip():
-            QMessageBox.warning(self, "Ошибка", "Введите фамилию")
+        if not self.last_name:
+            _warn(self, "Введите фамилию")
             return
 
-        if not self.first_name_edit.text().strip():
-            QMessageBox.warning(self, "Ошибка", "Введите имя")
+        if not self.first_name:
+            _warn(self, "Введите имя")
             return
 
         # Если все проверки пройдены, принимаем диалог
@@ -2,12 +2,20 @@
 Модуль управления театральными постановками.
 Содержит основную бизнес-логику приложения.
 """
+import heapq
 import random
-import re
 from data import DatabaseManager, ActorRank
 from logger import Logger
 from PySide6.QtWidgets import QTableWidgetItem, QLineEdit
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QRegularExpression
+from PySide6.QtGui import QRegularExpressionValidator
+
+# Допустимый текстовый ввод для валидатора Qt: буквы, цифры и пробелы, не более 100 символов
+_VALID_TEXT_QRE = QRegularExpression(r'^[а-яА-Яa-zA-Z0-9\s]{0,100}$')
+
+# Порядок званий актеров (от младшего к старшему) и позиция каждого звания
+RANK_ORDER = ('Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный')
+RANK_INDEX = {rank: i for i, rank in enumerate(RANK_ORDER)}
 
 
 class TheaterController:
@@ -20,6 +28,46 @@ class TheaterController:
         self.db = DatabaseManager()
         self.logger = Logger()
         self.is_connected = False
+        # Кэш состояния игры и списков актеров, сюжетов и спектаклей; сбрасывается при любой записи
+        self._cache = {}
+
+    def _cached(self, key, loader):
+        """
+        Список из кэша или, при его отсутствии, из БД с сохранением в кэш.
+        None (ошибка запроса) не кэшируется, чтобы следующий вызов повторил запрос.
+        """
+        rows = self._cache.get(key)
+        if rows is None:
+            rows = loader()
+            if rows is not None:
+                self._cache[key] = rows
+        return rows
+
+    def _cached_by_id(self, key, loader, id_field):
+        """Словарь id -> запись поверх закэшированного списка для поиска за O(1)."""
+        index_key = f'{key}_by_id'
+        index = self._cache.get(index_key)
+        if index is None:
+            rows = self._cached(key, loader)
+            if rows is None:
+                return {}
+            index = self._cache[index_key] = {row[id_field]: row for row in rows}
+        return index
+
+    def _find_performance(self, performance_id):
+        """Спектакль из загруженной истории или, если ее нет в кэше, отдельным запросом по ID."""
+        if 'performances' in self._cache:
+            return self._cached_by_id('performances', self.db.get_performances,
+                                      'performance_id').get(performance_id)
+        return self.db.get_performance(performance_id)
+
+    def _invalidate(self, *keys):
+        """Сброс указанных списков кэша вместе с их индексами (без аргументов - всего кэша)."""
+        if not keys:
+            self._cache.clear()
+        for key in keys:
+            self._cache.pop(key, None)
+            self._cache.pop(f'{key}_by_id', None)
 
     def set_connection_params(self, dbname, user, password, host, port):
         """Установка параметров подключения к БД."""
@@ -27,6 +75,7 @@ class TheaterController:
 
     def connect_to_database(self):
         """Установка соединения с БД."""
+        self._invalidate()
         self.is_connected = self.db.connect()
         return self.is_connected
 
@@ -34,47 +83,107 @@ class TheaterController:
         """Создание новой базы данных."""
         return self.db.create_database()
 
+    def bootstrap(self, dbname, user, password, host, port):
+        """
+        Создание базы данных, подключение к ней и инициализация схемы одним вызовом.
+        Каждый следующий этап выполняется только после успеха предыдущего.
+
+        Returns:
+            dict: Результаты этапов: created, connected, initialized
+        """
+        self.set_connection_params(dbname, user, password, host, port)
+        status = {'created': False, 'connected': False, 'initialized': False}
+        status['created'] = self.create_database()
+        if status['created']:
+            status['connected'] = self.connect_to_database()
+        if status['connected']:
+            status['initialized'] = self.initialize_database()
+        return status
+
     def initialize_database(self):
         """Инициализация схемы БД и заполнение тестовыми данными."""
         result1 = self.db.create_schema()
         result2 = self.db.init_sample_data()
+        self._invalidate()
         return result1 and result2
 
     def reset_database(self):
         """Сброс данных БД к начальному состоянию."""
-        return self.db.reset_database()
+        result = self.db.reset_database()
+        self._invalidate()
+        return result
 
     def reset_schema(self):
         """Сброс схемы БД и пересоздание всех таблиц."""
-        return self.db.reset_schema()
+        result = self.db.reset_schema()
+        self._invalidate()
+        return result
 
     def get_game_state(self):
         """Получение текущего состояния игры (год, капитал)."""
-        return self.db.get_game_data()
+        return self._cached('game_data', self.db.get_game_data)
 
     def get_all_actors(self):
         """Получение списка всех актеров."""
-        return self.db.get_actors()
+        return list(self._cached('actors', self.db.get_actors) or [])
+
+    def get_cached_actors(self):
+        """Список актеров из кэша без обращения к БД или None, если список еще не загружен."""
+        rows = self._cache.get('actors')
+        return None if rows is None else list(rows)
+
+    def fetch_actors_detached(self):
+        """
+        Загрузка актеров через отдельное соединение для фоновых потоков.
+        Кэш контроллера не изменяется: он используется только из главного потока.
+        """
+        return self.db.fetch_actors_detached()
 
     def get_all_plots(self):
         """Получение списка всех сюжетов."""
-        return self.db.get_plots()
+        return list(self._cached('plots', self.db.get_plots) or [])
+
+    def get_refresh_bundle(self):
+        """
+        Получение состояния игры, актеров и сюжетов одним вызовом при открытии диалогов.
+        Если чего-то нет в кэше, все три набора загружаются одним запросом к БД.
+
+        Returns:
+            dict: Ключи game_state, actors и plots
+        """
+        if not all(key in self._cache for key in ('game_data', 'actors', 'plots')):
+            bundle = self.db.fetch_bundle()
+            if bundle is not None:
+                for key, rows in bundle.items():
+                    if rows is not None:
+                        self._cache.setdefault(key, rows)
+        return {
+            'game_state': self.get_game_state(),
+            'actors': self.get_all_actors(),
+            'plots': self.get_all_plots()
+        }
 
     def add_new_plot(self, title, minimum_budget, production_cost, roles_count, demand, required_ranks):
         """Добавление нового сюжета в базу данных."""
-        return self.db.add_plot(title, minimum_budget, production_cost, roles_count, demand, required_ranks)
+        result = self.db.add_plot(title, minimum_budget, production_cost, roles_count, demand, required_ranks)
+        self._invalidate('plots')
+        return result
 
     def update_plot(self, plot_id, title, minimum_budget, production_cost, roles_count, demand, required_ranks):
         """Обновление данных сюжета."""
-        return self.db.update_plot(plot_id, title, minimum_budget, production_cost, roles_count, demand, required_ranks)
+        result = self.db.update_plot(plot_id, title, minimum_budget, production_cost, roles_count, demand, required_ranks)
+        self._invalidate('plots', 'performances')
+        return result
 
     def delete_plot_by_id(self, plot_id):
         """Удаление сюжета по ID."""
-        return self.db.delete_plot(plot_id)
+        result = self.db.delete_plot(plot_id)
+        self._invalidate('plots', 'performances')
+        return result
 
     def get_performances_history(self):
         """Получение истории всех постановок."""
-        return self.db.get_performances()
+        return list(self._cached('performances', self.db.get_performances) or [])
 
     def get_performance_details(self, performance_id):
         """
@@ -86,8 +195,7 @@ class TheaterController:
         Returns:
             dict: Информация о спектакле и задействованных актерах
         """
-        performances = self.db.get_performances()
-        performance = next((p for p in performances if p['performance_id'] == performance_id), None)
+        performance = self._find_performance(performance_id)
 
         if not performance:
             return None
@@ -112,12 +220,11 @@ class TheaterController:
         Returns:
             tuple: (успех операции (bool), ID спектакля или сообщение об ошибке)
         """
-        game_data = self.db.get_game_data()
+        game_data = self.get_game_state()
         if game_data['capital'] < budget:
             return False, "Недостаточно средств в капитале"
 
-        plots = self.db.get_plots()
-        plot = next((p for p in plots if p['plot_id'] == plot_id), None)
+        plot = self._cached_by_id('plots', self.db.get_plots, 'plot_id').get(plot_id)
 
         if not plot:
             return False, "Сюжет не найден"
@@ -126,10 +233,12 @@ class TheaterController:
             return False, "Бюджет меньше минимально необходимого для данного сюжета"
 
         performance_id = self.db.create_performance(title, plot_id, year, budget)
+        self._invalidate('performances')
 
         if performance_id:
             new_capital = game_data['capital'] - budget
             self.db.update_game_data(year, new_capital)
+            self._invalidate('game_data')
             return True, performance_id
         else:
             return False, "Ошибка при создании спектакля"
@@ -150,8 +259,7 @@ class TheaterController:
         """
         base_cost = 30000
 
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
-        rank_bonus = rank_order.index(actor['rank']) * 10000
+        rank_bonus = RANK_INDEX[actor['rank']] * 10000
 
         experience_bonus = actor['experience'] * 2000
         awards_bonus = actor['awards_count'] * 5000
@@ -175,14 +283,12 @@ class TheaterController:
         Returns:
             tuple: (успех операции (bool), результаты спектакля (dict))
         """
-        performances = self.db.get_performances()
-        performance = next((p for p in performances if p['performance_id'] == performance_id), None)
+        performance = self._find_performance(performance_id)
 
         if not performance or performance['is_completed']:
             return False, "Спектакль не найден или уже завершен"
 
-        plots = self.db.get_plots()
-        plot = next((p for p in plots if p['plot_id'] == performance['plot_id']), None)
+        plot = self._cached_by_id('plots', self.db.get_plots, 'plot_id').get(performance['plot_id'])
 
         actors = self.db.get_actors_in_performance(performance_id)
 
@@ -198,37 +304,22 @@ class TheaterController:
         unexpected_expenses = int(actual_budget * random.uniform(0.05, 0.15))
         self.logger.info(f"Непредвиденные расходы спектакля {performance_id}: {unexpected_expenses}")
 
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
         actors_match_requirements = True
 
-        required_ranks = plot.get('required_ranks', [])
-        if isinstance(required_ranks, str) and required_ranks.startswith('{') and required_ranks.endswith('}'):
-            required_ranks = required_ranks[1:-1].split(',')
-            required_ranks = [r.strip('"') for r in required_ranks]
-
-        if required_ranks and len(required_ranks) > 0:
-            for i, actor in enumerate(actors):
-                if i < len(required_ranks):
-                    required_rank = required_ranks[i]
-                    if required_rank in rank_order:
-                        actor_rank_index = rank_order.index(actor['rank'])
-                        required_rank_index = rank_order.index(required_rank)
-                        if actor_rank_index < required_rank_index:
-                            actors_match_requirements = False
-                            self.logger.info(
-                                f"Актер {actor['last_name']} ({actor['rank']}) не соответствует требованию {required_rank}")
-                            break
-
-        actors_bonus = 0
-        for actor in actors:
-            rank_index = rank_order.index(actor['rank'])
-            rank_multiplier = 1 + (rank_index * 0.15)
-
-            award_bonus = actor['awards_count'] * 0.05
-            exp_bonus = actor['experience'] * 0.01
-
-            actor_contribution = actor['contract_cost'] * rank_multiplier * (1 + award_bonus + exp_bonus)
-            actors_bonus += actor_contribution
+        # Роли без требования и лишние актеры просто не попадают в пары zip
+        for actor, required_rank in zip(actors, plot['required_ranks']):
+            required_rank_index = RANK_INDEX.get(required_rank)
+            if required_rank_index is not None and RANK_INDEX[actor['rank']] < required_rank_index:
+                actors_match_requirements = False
+                self.logger.info(
+                    f"Актер {actor['last_name']} ({actor['rank']}) не соответствует требованию {required_rank}")
+                break
+
+        # Вклад актера: гонорар * (1 + 0.15 * звание) * (1 + 0.05 * награды + 0.01 * опыт)
+        actors_bonus = sum(
+            actor['contract_cost'] * (1 + RANK_INDEX[actor['rank']] * 0.15)
+            * (1 + actor['awards_count'] * 0.05 + actor['experience'] * 0.01)
+            for actor in actors)
 
         fate_roll = random.random()
         fail_chance = 0.4 if actors_match_requirements else 0.6
@@ -248,28 +339,27 @@ class TheaterController:
         total_expenses = actual_budget + unexpected_expenses
         profit = total_revenue - total_expenses
 
-        self.db.update_performance_budget(performance_id, total_expenses)
-        self.db.complete_performance(performance_id, total_revenue)
-
-        game_data = self.db.get_game_data()
-        new_capital = game_data['capital'] + total_revenue + saved_budget - unexpected_expenses
-        current_year = game_data['current_year'] + 1
-        self.db.update_game_data(current_year, new_capital)
-
         successful_actors = []
+        promote_id = None
         if profit > 0:
-            sorted_actors = sorted(actors,
-                                   key=lambda a: (rank_order.index(a['rank']),
-                                                  a['experience'],
-                                                  a['awards_count']),
-                                   reverse=True)
-
-            for i, actor in enumerate(sorted_actors[:3]):
-                self.db.award_actor(actor['actor_id'])
-                successful_actors.append(actor)
-
-                if i == 0 and profit > total_expenses * 0.3:
-                    self.db.upgrade_actor_rank(actor['actor_id'])
+            # Три лучших актера по званию, опыту и наградам без сортировки всего состава
+            successful_actors = heapq.nlargest(3, actors,
+                                               key=lambda a: (RANK_INDEX[a['rank']],
+                                                              a['experience'],
+                                                              a['awards_count']))
+            # Лучший актер повышается в звании только при крупной прибыли
+            if successful_actors and profit > total_expenses * 0.3:
+                promote_id = successful_actors[0]['actor_id']
+
+        # Бюджет, завершение, капитал и награды сохраняются одной транзакцией
+        capital_change = total_revenue + saved_budget - unexpected_expenses
+        finalized = self.db.finalize_performance(
+            performance_id, total_expenses, total_revenue, capital_change,
+            [actor['actor_id'] for actor in successful_actors], promote_id)
+        # Завершение спектакля меняет опыт, награды и звания актеров, а также год и капитал
+        self._invalidate('performances', 'actors', 'game_data')
+        if not finalized:
+            return False, "Ошибка сохранения результатов спектакля"
 
         return True, {
             'revenue': total_revenue,
@@ -288,7 +378,7 @@ class TheaterController:
         Returns:
             dict: Новый год, капитал и доход от продажи прав
         """
-        game_data = self.db.get_game_data()
+        game_data = self.get_game_state()
         current_year = game_data['current_year']
         current_capital = game_data['capital']
 
@@ -297,6 +387,7 @@ class TheaterController:
         new_capital = current_capital + rights_sale
         new_year = current_year + 1
         self.db.update_game_data(new_year, new_capital)
+        self._invalidate('game_data')
 
         return {
             'year': new_year,
@@ -305,24 +396,22 @@ class TheaterController:
         }
 
     def add_new_actor(self, last_name, first_name, patronymic, rank, awards_count, experience):
-        """Добавление нового актера в базу данных."""
-        return self.db.add_actor(last_name, first_name, patronymic, rank, awards_count, experience)
+        """Добавление нового актера в базу данных. Возвращает добавленную запись или None."""
+        result = self.db.add_actor(last_name, first_name, patronymic, rank, awards_count, experience)
+        self._invalidate('actors')
+        return result
 
     def update_actor(self, actor_id, last_name, first_name, patronymic, rank, awards_count, experience):
         """Обновление данных актера."""
-        return self.db.update_actor(actor_id, last_name, first_name, patronymic, rank, awards_count, experience)
+        result = self.db.update_actor(actor_id, last_name, first_name, patronymic, rank, awards_count, experience)
+        self._invalidate('actors')
+        return result
 
     def delete_actor_by_id(self, actor_id):
         """Удаление актера по его ID."""
-        return self.db.delete_actor(actor_id)
-
-    def is_valid_text_input(self, text):
-        """
-        Проверка валидности текстового ввода.
-        Разрешены только буквы, цифры и пробелы.
-        Максимальная длина - 100 символов.
-        """
-        return len(text) <= 100 and bool(re.match(r'^[а-яА-Яa-zA-Z0-9\s]+$', text))
+        result = self.db.delete_actor(actor_id)
+        self._invalidate('actors')
+        return result
 
     def close(self):
         """Закрытие соединения с БД."""
@@ -344,43 +433,63 @@ class TheaterController:
 
     def add_column(self, table_name, column_name, data_type, nullable=True, default=None):
         """Добавление столбца в таблицу."""
-        return self.db.add_table_column(table_name, column_name, data_type, nullable, default)
+        result = self.db.add_table_column(table_name, column_name, data_type, nullable, default)
+        self._invalidate()
+        return result
 
     def drop_column(self, table_name, column_name):
         """Удаление столбца из таблицы."""
-        return self.db.drop_table_column(table_name, column_name)
+        result = self.db.drop_table_column(table_name, column_name)
+        self._invalidate()
+        return result
 
     def rename_column(self, table_name, old_name, new_name):
         """Переименование столбца."""
-        return self.db.rename_table_column(table_name, old_name, new_name)
+        result = self.db.rename_table_column(table_name, old_name, new_name)
+        self._invalidate()
+        return result
 
     def rename_table(self, old_name, new_name):
         """Переименование таблицы."""
-        return self.db.rename_table(old_name, new_name)
+        result = self.db.rename_table(old_name, new_name)
+        self._invalidate()
+        return result
 
     def alter_column_type(self, table_name, column_name, new_type):
         """Изменение типа столбца."""
-        return self.db.alter_column_type(table_name, column_name, new_type)
+        result = self.db.alter_column_type(table_name, column_name, new_type)
+        self._invalidate()
+        return result
 
     def set_constraint(self, table_name, column_name, constraint_type, constraint_value=None):
         """Установка ограничения на столбец."""
-        return self.db.set_column_constraint(table_name, column_name, constraint_type, constraint_value)
+        result = self.db.set_column_constraint(table_name, column_name, constraint_type, constraint_value)
+        self._invalidate()
+        return result
 
     def drop_constraint(self, table_name, column_name, constraint_type):
         """Снятие ограничения со столбца."""
-        return self.db.drop_column_constraint(table_name, column_name, constraint_type)
+        result = self.db.drop_column_constraint(table_name, column_name, constraint_type)
+        self._invalidate()
+        return result
 
     def insert_row(self, table_name, data):
         """Вставка новой записи."""
-        return self.db.insert_table_row(table_name, data)
+        result = self.db.insert_table_row(table_name, data)
+        self._invalidate()
+        return result
 
     def update_row(self, table_name, data, where_clause, where_params):
         """Обновление записи."""
-        return self.db.update_table_row(table_name, data, where_clause, where_params)
+        result = self.db.update_table_row(table_name, data, where_clause, where_params)
+        self._invalidate()
+        return result
 
     def delete_row(self, table_name, where_clause, where_params):
         """Удаление записи."""
-        return self.db.delete_table_row(table_name, where_clause, where_params)
+        result = self.db.delete_table_row(table_name, where_clause, where_params)
+        self._invalidate()
+        return result
 
     def execute_join(self, tables_info, selected_columns, join_conditions, where=None, order_by=None, group_by=None,
                      having=None):
@@ -394,22 +503,33 @@ class TheaterController:
 
     def execute_update(self, query, params=None):
         """Выполнение произвольного UPDATE запроса."""
-        return self.db.execute_update_query(query, params)
+        result = self.db.execute_update_query(query, params)
+        self._invalidate()
+        return result
 
     def create_table(self, table_name, columns):
         """Создание новой таблицы."""
-        return self.db.create_table(table_name, columns)
+        result = self.db.create_table(table_name, columns)
+        self._invalidate()
+        return result
 
     def drop_table(self, table_name):
         """Удаление таблицы."""
-        return self.db.drop_table(table_name)
+        result = self.db.drop_table(table_name)
+        self._invalidate()
+        return result
+
+
+def format_rub(value):
+    """Форматирование денежной суммы с пробелами между разрядами: 1 500 000 ₽."""
+    return f"{value:_} ₽".replace('_', ' ')
 
 
 # Вспомогательные классы для таблиц
 
-class NumericTableItem(QTableWidgetItem):
+class _ValueTableItem(QTableWidgetItem):
     """
-    Элемент таблицы для числовых значений с правильной сортировкой.
+    Общая база элементов таблицы, сортируемых по числовому значению.
     """
 
     def __init__(self, text, value):
@@ -418,11 +538,17 @@ class NumericTableItem(QTableWidgetItem):
 
     def __lt__(self, other):
         """Сравнение по числовому значению, а не по тексту."""
-        if hasattr(other, 'value'):
+        if isinstance(other, _ValueTableItem):
             return self.value < other.value
         return super().__lt__(other)
 
 
+class NumericTableItem(_ValueTableItem):
+    """
+    Элемент таблицы для числовых значений с правильной сортировкой.
+    """
+
+
 class RankTableItem(QTableWidgetItem):
     """
     Элемент таблицы для званий актеров с правильной сортировкой.
@@ -430,8 +556,7 @@ class RankTableItem(QTableWidgetItem):
 
     def __init__(self, text):
         super().__init__(text)
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
-        self.rank_index = rank_order.index(text) if text in rank_order else -1
+        self.rank_index = RANK_INDEX.get(text, -1)
 
     def __lt__(self, other):
         """Сравнение по порядку званий, а не по алфавиту."""
@@ -440,21 +565,11 @@ class RankTableItem(QTableWidgetItem):
         return super().__lt__(other)
 
 
-class CurrencyTableItem(QTableWidgetItem):
+class CurrencyTableItem(_ValueTableItem):
     """
     Элемент таблицы для денежных значений с правильной сортировкой.
     """
 
-    def __init__(self, text, value):
-        super().__init__(text)
-        self.value = value
-
-    def __lt__(self, other):
-        """Сравнение по числовому значению, а не по тексту."""
-        if hasattr(other, 'value'):
-            return self.value < other.value
-        return super().__lt__(other)
-
 
 class DateTableItem(QTableWidgetItem):
     """
@@ -467,7 +582,7 @@ class DateTableItem(QTableWidgetItem):
 
     def __lt__(self, other):
         """Сравнение по дате, а не по тексту."""
-        if hasattr(other, 'date_value'):
+        if isinstance(other, DateTableItem):
             return self.date_value < other.date_value
         return super().__lt__(other)
 
@@ -483,7 +598,7 @@ class BooleanTableItem(QTableWidgetItem):
 
     def __lt__(self, other):
         """Сравнение по булевому значению (False < True)."""
-        if hasattr(other, 'bool_value'):
+        if isinstance(other, BooleanTableItem):
             return self.bool_value < other.bool_value
         return super().__lt__(other)
 
@@ -499,7 +614,7 @@ class TimestampTableItem(QTableWidgetItem):
 
     def __lt__(self, other):
         """Сравнение по временной метке, а не по тексту."""
-        if hasattr(other, 'timestamp_value'):
+        if isinstance(other, TimestampTableItem):
             return self.timestamp_value < other.timestamp_value
         return super().__lt__(other)
 
@@ -507,53 +622,26 @@ class TimestampTableItem(QTableWidgetItem):
 class ValidatedLoginLineEdit(QLineEdit):
     """
     Поле ввода с валидацией для окна логина.
-    Разрешает только определенные символы.
+    Разрешает только латинские буквы, цифры, точку, подчеркивание и дефис.
     """
+    # Валидатор общий для всех полей; недопустимые символы отклоняются самим QLineEdit
+    _SHARED_VALIDATOR = QRegularExpressionValidator(QRegularExpression(r'^[A-Za-z0-9._\-]*$'))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.controller = TheaterController()
-
-    def keyPressEvent(self, event):
-        """Обработка нажатия клавиш с валидацией."""
-        old_text = self.text()
-        cursor_pos = self.cursorPosition()
-
-        super().keyPressEvent(event)
-
-        new_text = self.text()
-
-        if not new_text:
-            return
-
-        if self.controller.is_valid_text_input(new_text):
-            return
-
-        self.setText(old_text)
-        self.setCursorPosition(cursor_pos)
+        self.setValidator(self._SHARED_VALIDATOR)
 
 
 class ValidatedLineEdit(QLineEdit):
     """
     Поле ввода с валидацией текста.
-    Разрешает только определенные символы, заданные в контроллере.
+    Разрешает только буквы, цифры и пробелы (не более 100 символов).
+    Недопустимый ввод отклоняется валидатором Qt до изменения текста.
     """
+    # Валидатор общий для всех полей, как и в ValidatedLoginLineEdit
+    _SHARED_VALIDATOR = QRegularExpressionValidator(_VALID_TEXT_QRE)
 
     def __init__(self, controller, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.controller = controller
-
-    def keyPressEvent(self, event):
-        """Обработка нажатия клавиш с валидацией."""
-        old_text = self.text()
-        cursor_pos = self.cursorPosition()
-
-        super().keyPressEvent(event)
-
-        new_text = self.text()
-
-        if not new_text or self.controller.is_valid_text_input(new_text):
-            return
-
-        self.setText(old_text)
-        self.setCursorPosition(cursor_pos)
\ No newline at end of file
+        self.setValidator(self._SHARED_VALIDATOR)
\ No newline at end of file
@@ -2,14 +2,28 @@
 Модуль для работы с данными театра в базе данных PostgreSQL.
 Содержит классы для хранения, доступа и манипуляции данными.
 """
+from contextlib import closing
+
 import psycopg2
 from psycopg2 import sql, extensions
-from psycopg2.extras import DictCursor
+from psycopg2.extras import DictCursor, execute_values
 import enum
 from datetime import datetime, date
 from logger import Logger
 
 
+def _parse_rank_array(value):
+    """
+    Преобразование массива званий в список строк.
+    psycopg2 не знает тип actor_rank[] и возвращает его строкой вида '{Ведущий,Мастер}'.
+    """
+    if isinstance(value, str):
+        if value.startswith('{') and value.endswith('}'):
+            return [rank.strip('"') for rank in value[1:-1].split(',')] if len(value) > 2 else []
+        return []
+    return list(value or [])
+
+
 class ActorRank(enum.Enum):
     """
     Перечисление званий актеров театра.
@@ -25,10 +39,11 @@ class ActorRank(enum.Enum):
     @classmethod
     def from_value(cls, value):
         """Получение объекта перечисления по его значению."""
-        for member in cls:
-            if member.value == value:
-                return member
-        raise ValueError(f"'{value}' не является допустимым званием актера")
+        try:
+            # Поиск по словарю значений, который Enum строит при создании класса
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"'{value}' не является допустимым званием актера") from None
 
     @classmethod
     def compare(cls, rank1, rank2):
@@ -38,17 +53,87 @@ class ActorRank(enum.Enum):
         Returns:
             int: -1 если rank1 < rank2, 0 если равны, 1 если rank1 > rank2
         """
-        r1 = cls.from_value(rank1)
-        r2 = cls.from_value(rank2)
-
-        if r1.value == r2.value:
-            return 0
-
-        rank_order = [cls.BEGINNER, cls.REGULAR, cls.LEAD, cls.MASTER, cls.HONORED, cls.PEOPLE]
-        idx1 = rank_order.index(r1)
-        idx2 = rank_order.index(r2)
-
-        return -1 if idx1 < idx2 else 1
+        idx1 = _RANK_POSITION[cls.from_value(rank1)]
+        idx2 = _RANK_POSITION[cls.from_value(rank2)]
+        return (idx1 > idx2) - (idx1 < idx2)
+
+
+# Позиция каждого звания в иерархии (члены перечисления объявлены от младшего к старшему)
+_RANK_POSITION = {rank: i for i, rank in enumerate(ActorRank)}
+
+
+# Схема БД: все объекты создаются одним запросом (несколько команд в одном execute)
+_SCHEMA_SQL = """
+-- Тип перечисления для званий актеров
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'actor_rank') THEN
+        CREATE TYPE actor_rank AS ENUM (
+            'Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный'
+        );
+    END IF;
+END$$;
+
+-- Таблица актеров
+CREATE TABLE IF NOT EXISTS actors (
+    actor_id SERIAL PRIMARY KEY,
+    last_name VARCHAR(100) NOT NULL,
+    first_name VARCHAR(100) NOT NULL,
+    patronymic VARCHAR(100),
+    rank actor_rank NOT NULL DEFAULT 'Начинающий',
+    awards_count INTEGER NOT NULL DEFAULT 0 CHECK (awards_count >= 0),
+    experience INTEGER NOT NULL DEFAULT 0 CHECK (experience >= 0),
+    CONSTRAINT actor_full_name_unique UNIQUE (last_name, first_name, patronymic)
+);
+
+-- Таблица сюжетов
+CREATE TABLE IF NOT EXISTS plots (
+    plot_id SERIAL PRIMARY KEY,
+    title VARCHAR(200) NOT NULL UNIQUE,
+    minimum_budget INTEGER NOT NULL CHECK (minimum_budget > 0),
+    production_cost INTEGER NOT NULL CHECK (production_cost > 0),
+    roles_count INTEGER NOT NULL CHECK (roles_count >= 1),
+    demand INTEGER NOT NULL CHECK (demand BETWEEN 1 AND 10),
+    required_ranks actor_rank[] NOT NULL DEFAULT ARRAY['Начинающий']::actor_rank[]
+);
+
+-- Таблица спектаклей
+CREATE TABLE IF NOT EXISTS performances (
+    performance_id SERIAL PRIMARY KEY,
+    title VARCHAR(200) NOT NULL,
+    plot_id INTEGER NOT NULL,
+    year INTEGER NOT NULL CHECK (year >= 2022),
+    budget INTEGER NOT NULL CHECK (budget > 0),
+    revenue INTEGER DEFAULT 0 CHECK (revenue >= 0),
+    is_completed BOOLEAN DEFAULT FALSE,
+    FOREIGN KEY (plot_id) REFERENCES plots(plot_id) ON DELETE RESTRICT,
+    CONSTRAINT unique_performance_per_year UNIQUE(year)
+);
+
+-- Связи актеров и спектаклей
+CREATE TABLE IF NOT EXISTS actor_performances (
+    actor_id INTEGER NOT NULL,
+    performance_id INTEGER NOT NULL,
+    role VARCHAR(100) NOT NULL,
+    contract_cost INTEGER NOT NULL CHECK (contract_cost > 0),
+    PRIMARY KEY (actor_id, performance_id),
+    FOREIGN KEY (actor_id) REFERENCES actors(actor_id) ON DELETE RESTRICT,
+    FOREIGN KEY (performance_id) REFERENCES performances(performance_id) ON DELETE CASCADE
+);
+
+-- Игровые данные
+CREATE TABLE IF NOT EXISTS game_data (
+    id INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    current_year INTEGER NOT NULL DEFAULT 2025 CHECK (current_year >= 2022),
+    capital BIGINT NOT NULL DEFAULT 1000000 CHECK (capital >= 0)
+);
+
+-- Индексы для проверок при удалении и выборок по спектаклю
+-- (поиск по actor_id в actor_performances уже покрывает первичный ключ)
+CREATE INDEX IF NOT EXISTS idx_ap_perf_cost ON actor_performances(performance_id, contract_cost DESC);
+CREATE INDEX IF NOT EXISTS idx_perf_plot ON performances(plot_id);
+CREATE INDEX IF NOT EXISTS idx_perf_active ON performances(performance_id) WHERE is_completed = FALSE;
+"""
 
 
 class DatabaseManager:
@@ -64,6 +149,10 @@ class DatabaseManager:
         self.connection_params = None
         self.connection = None
         self.cursor = None
+        # Курсор с обычными кортежами для запросов, где строки читаются только по индексу
+        self.scalar_cursor = None
+        # Имена запросов, подготовленных (PREPARE) в текущем соединении
+        self._prepared = set()
 
     def set_connection_params(self, dbname, user, password, host, port):
         """Установка параметров подключения к базе данных."""
@@ -90,6 +179,8 @@ class DatabaseManager:
         try:
             self.connection = psycopg2.connect(**self.connection_params, client_encoding='UTF8')
             self.cursor = self.connection.cursor(cursor_factory=DictCursor)
+            self.scalar_cursor = self.connection.cursor()
+            self._prepared.clear()
             self.logger.info(f"Подключение к БД {self.connection_params['dbname']} успешно")
             return True
         except psycopg2.Error as e:
@@ -154,10 +245,30 @@ class DatabaseManager:
             self.logger.error(f"Ошибка создания БД: {str(e)}")
             return False
 
+    def _execute_prepared(self, name, query, params=()):
+        """
+        Выполнение часто используемого запроса через PREPARE/EXECUTE.
+        Запрос разбирается и планируется сервером один раз на соединение.
+        """
+        if name not in self._prepared:
+            self.cursor.execute(f"PREPARE {name} AS {query}")
+            self._prepared.add(name)
+        execute_sql = f"EXECUTE {name} ({', '.join(['%s'] * len(params))})" if params else f"EXECUTE {name}"
+        try:
+            self.cursor.execute(execute_sql, params)
+        except psycopg2.errors.FeatureNotSupported:
+            # Столбцы таблицы изменились (например, в редакторе таблиц) - готовим запрос заново
+            self.connection.rollback()
+            self.cursor.execute(f"DEALLOCATE {name}")
+            self.cursor.execute(f"PREPARE {name} AS {query}")
+            self.cursor.execute(execute_sql, params)
+
     def disconnect(self):
         """Закрытие соединения с базой данных."""
         if self.cursor:
             self.cursor.close()
+        if self.scalar_cursor:
+            self.scalar_cursor.close()
         if self.connection:
             self.connection.close()
             self.logger.info("Соединение с БД закрыто")
@@ -170,82 +281,7 @@ class DatabaseManager:
             bool: Успешность создания схемы
         """
         try:
-            # Тип перечисления для званий актеров
-            self.cursor.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'actor_rank') THEN
-                        CREATE TYPE actor_rank AS ENUM (
-                            'Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный'
-                        );
-                    END IF;
-                END$$;
-            """)
-
-            # Таблица актеров
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS actors (
-                    actor_id SERIAL PRIMARY KEY,
-                    last_name VARCHAR(100) NOT NULL,
-                    first_name VARCHAR(100) NOT NULL,
-                    patronymic VARCHAR(100),
-                    rank actor_rank NOT NULL DEFAULT 'Начинающий',
-                    awards_count INTEGER NOT NULL DEFAULT 0 CHECK (awards_count >= 0),
-                    experience INTEGER NOT NULL DEFAULT 0 CHECK (experience >= 0),
-                    CONSTRAINT actor_full_name_unique UNIQUE (last_name, first_name, patronymic)
-                );
-            """)
-
-            # Таблица сюжетов
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS plots (
-                    plot_id SERIAL PRIMARY KEY,
-                    title VARCHAR(200) NOT NULL UNIQUE,
-                    minimum_budget INTEGER NOT NULL CHECK (minimum_budget > 0),
-                    production_cost INTEGER NOT NULL CHECK (production_cost > 0),
-                    roles_count INTEGER NOT NULL CHECK (roles_count >= 1),
-                    demand INTEGER NOT NULL CHECK (demand BETWEEN 1 AND 10),
-                    required_ranks actor_rank[] NOT NULL DEFAULT ARRAY['Начинающий']::actor_rank[]
-                );
-            """)
-
-            # Таблица спектаклей
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS performances (
-                    performance_id SERIAL PRIMARY KEY,
-                    title VARCHAR(200) NOT NULL,
-                    plot_id INTEGER NOT NULL,
-                    year INTEGER NOT NULL CHECK (year >= 2022),
-                    budget INTEGER NOT NULL CHECK (budget > 0),
-                    revenue INTEGER DEFAULT 0 CHECK (revenue >= 0),
-                    is_completed BOOLEAN DEFAULT FALSE,
-                    FOREIGN KEY (plot_id) REFERENCES plots(plot_id) ON DELETE RESTRICT,
-                    CONSTRAINT unique_performance_per_year UNIQUE(year)
-                );
-            """)
-
-            # Связи актеров и спектаклей
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS actor_performances (
-                    actor_id INTEGER NOT NULL,
-                    performance_id INTEGER NOT NULL,
-                    role VARCHAR(100) NOT NULL,
-                    contract_cost INTEGER NOT NULL CHECK (contract_cost > 0),
-                    PRIMARY KEY (actor_id, performance_id),
-                    FOREIGN KEY (actor_id) REFERENCES actors(actor_id) ON DELETE RESTRICT,
-                    FOREIGN KEY (performance_id) REFERENCES performances(performance_id) ON DELETE CASCADE
-                );
-            """)
-
-            # Игровые данные
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS game_data (
-                    id INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
-                    current_year INTEGER NOT NULL DEFAULT 2025 CHECK (current_year >= 2022),
-                    capital BIGINT NOT NULL DEFAULT 1000000 CHECK (capital >= 0)
-                );
-            """)
-
+            self.cursor.execute(_SCHEMA_SQL)
             self.connection.commit()
             self.logger.info("Схема БД успешно создана")
             return True
@@ -284,12 +320,12 @@ class DatabaseManager:
                 ('Лебедев', 'Сергей', 'Николаевич', 'Заслуженный', 6, 12)
             ]
 
-            for actor in actors:
-                self.cursor.execute("""
-                    INSERT INTO actors (last_name, first_name, patronymic, rank, awards_count, experience)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (last_name, first_name, patronymic) DO NOTHING
-                """, actor)
+            # Каждая таблица заполняется одним многострочным INSERT вместо запроса на строку
+            execute_values(self.cursor, """
+                INSERT INTO actors (last_name, first_name, patronymic, rank, awards_count, experience)
+                VALUES %s
+                ON CONFLICT (last_name, first_name, patronymic) DO NOTHING
+            """, actors)
 
             # Сюжеты
             plots = [
@@ -305,12 +341,11 @@ class DatabaseManager:
                 ('Маскарад', 650000, 400000, 8, 8, ['Мастер'])
             ]
 
-            for plot in plots:
-                self.cursor.execute("""
-                    INSERT INTO plots (title, minimum_budget, production_cost, roles_count, demand, required_ranks)
-                    VALUES (%s, %s, %s, %s, %s, %s::actor_rank[])
-                    ON CONFLICT (title) DO NOTHING
-                """, plot)
+            execute_values(self.cursor, """
+                INSERT INTO plots (title, minimum_budget, production_cost, roles_count, demand, required_ranks)
+                VALUES %s
+                ON CONFLICT (title) DO NOTHING
+            """, plots, template="(%s, %s, %s, %s, %s, %s::actor_rank[])")
 
             # Прошлые постановки
             past_performances = [
@@ -319,12 +354,11 @@ class DatabaseManager:
                 ('Чайка над морем', 3, 2024, 500000, 780000, True)
             ]
 
-            for perf in past_performances:
-                self.cursor.execute("""
-                    INSERT INTO performances (title, plot_id, year, budget, revenue, is_completed)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (year) DO NOTHING
-                """, perf)
+            execute_values(self.cursor, """
+                INSERT INTO performances (title, plot_id, year, budget, revenue, is_completed)
+                VALUES %s
+                ON CONFLICT (year) DO NOTHING
+            """, past_performances)
 
             # Участники постановок
             actor_perfs = [
@@ -351,12 +385,11 @@ class DatabaseManager:
                 (7, 3, 'Маша', 90000)
             ]
 
-            for ap in actor_perfs:
-                self.cursor.execute("""
-                    INSERT INTO actor_performances (actor_id, performance_id, role, contract_cost)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (actor_id, performance_id) DO NOTHING
-                """, ap)
+            execute_values(self.cursor, """
+                INSERT INTO actor_performances (actor_id, performance_id, role, contract_cost)
+                VALUES %s
+                ON CONFLICT (actor_id, performance_id) DO NOTHING
+            """, actor_perfs)
 
             self.connection.commit()
             self.logger.info("Тестовые данные успешно добавлены")
@@ -374,15 +407,11 @@ class DatabaseManager:
             bool: Успешность сброса
         """
         try:
-            self.cursor.execute("TRUNCATE TABLE actor_performances CASCADE")
-            self.cursor.execute("TRUNCATE TABLE performances CASCADE")
-            self.cursor.execute("TRUNCATE TABLE actors CASCADE")
-            self.cursor.execute("TRUNCATE TABLE plots CASCADE")
-            self.cursor.execute("TRUNCATE TABLE game_data CASCADE")
-
-            self.cursor.execute("ALTER SEQUENCE actors_actor_id_seq RESTART WITH 1")
-            self.cursor.execute("ALTER SEQUENCE plots_plot_id_seq RESTART WITH 1")
-            self.cursor.execute("ALTER SEQUENCE performances_performance_id_seq RESTART WITH 1")
+            # Очистка всех таблиц и сброс их последовательностей одной командой
+            self.cursor.execute("""
+                TRUNCATE TABLE actor_performances, performances, actors, plots, game_data
+                RESTART IDENTITY CASCADE
+            """)
 
             self.init_sample_data()
 
@@ -396,26 +425,23 @@ class DatabaseManager:
 
     def reset_schema(self):
         """
-        Сброс схемы базы данных (удаление всех таблиц и типов).
+        Сброс схемы базы данных: удаление и пересоздание всех таблиц одним запросом.
 
         Returns:
             bool: Успешность сброса
         """
         try:
+            # Тип actor_rank сохраняется: блок DO в схеме пропустит его создание
             self.cursor.execute("""
                 DROP TABLE IF EXISTS actor_performances CASCADE;
                 DROP TABLE IF EXISTS performances CASCADE;
                 DROP TABLE IF EXISTS actors CASCADE;
                 DROP TABLE IF EXISTS plots CASCADE;
                 DROP TABLE IF EXISTS game_data CASCADE;
-                DROP TYPE IF EXISTS actor_rank CASCADE;
-            """)
+            """ + _SCHEMA_SQL)
             self.connection.commit()
-            self.logger.info("Схема БД успешно удалена")
-
-            success = self.create_schema()
-
-            return success
+            self.logger.info("Схема БД успешно пересоздана")
+            return True
         except psycopg2.Error as e:
             self.connection.rollback()
             self.logger.error(f"Ошибка сброса схемы БД: {str(e)}")
@@ -426,7 +452,7 @@ class DatabaseManager:
         Получение списка всех актеров.
 
         Returns:
-            list: Список словарей с данными актеров
+            list: Список словарей с данными актеров или None при ошибке
         """
         try:
             self.cursor.execute("SELECT * FROM actors ORDER BY actor_id")
@@ -434,22 +460,43 @@ class DatabaseManager:
         except psycopg2.Error as e:
             self.logger.error(f"Ошибка получения списка актеров: {str(e)}")
             self.connection.rollback()
-            return []
+            return None
+
+    def fetch_actors_detached(self):
+        """
+        Получение списка актеров через отдельное кратковременное соединение.
+        Предназначено для фоновых потоков: курсор основного соединения не используется.
+
+        Returns:
+            list: Список словарей с данными актеров или None при ошибке
+        """
+        try:
+            with closing(psycopg2.connect(**self.connection_params, client_encoding='UTF8')) as conn:
+                with conn.cursor(cursor_factory=DictCursor) as cursor:
+                    cursor.execute("SELECT * FROM actors ORDER BY actor_id")
+                    return cursor.fetchall()
+        except psycopg2.Error as e:
+            self.logger.error(f"Ошибка фоновой загрузки списка актеров: {str(e)}")
+            return None
 
     def get_plots(self):
         """
         Получение списка всех сюжетов.
 
         Returns:
-            list: Список словарей с данными сюжетов
+            list: Список словарей с данными сюжетов или None при ошибке
         """
         try:
             self.cursor.execute("SELECT * FROM plots ORDER BY title")
-            return self.cursor.fetchall()
+            plots = self.cursor.fetchall()
+            # Разбираем массив званий один раз при загрузке, а не в каждом потребителе
+            for plot in plots:
+                plot['required_ranks'] = _parse_rank_array(plot['required_ranks'])
+            return plots
         except psycopg2.Error as e:
             self.logger.error(f"Ошибка получения списка сюжетов: {str(e)}")
             self.connection.rollback()
-            return []
+            return None
 
     def get_performances(self, year=None):
         """
@@ -459,18 +506,18 @@ class DatabaseManager:
             year: Год для фильтрации (опционально)
 
         Returns:
-            list: Список словарей с данными спектаклей
+            list: Список словарей с данными спектаклей или None при ошибке
         """
         try:
             if year:
-                self.cursor.execute("""
+                self._execute_prepared("get_performances_year", """
                     SELECT p.*, pl.title as plot_title 
                     FROM performances p
                     JOIN plots pl ON p.plot_id = pl.plot_id
-                    WHERE p.year = %s
+                    WHERE p.year = $1
                 """, (year,))
             else:
-                self.cursor.execute("""
+                self._execute_prepared("get_performances_all", """
                     SELECT p.*, pl.title as plot_title 
                     FROM performances p
                     JOIN plots pl ON p.plot_id = pl.plot_id
@@ -480,7 +527,30 @@ class DatabaseManager:
         except psycopg2.Error as e:
             self.logger.error(f"Ошибка получения спектаклей: {str(e)}")
             self.connection.rollback()
-            return []
+            return None
+
+    def get_performance(self, performance_id):
+        """
+        Получение одного спектакля по ID.
+
+        Args:
+            performance_id: ID спектакля
+
+        Returns:
+            dict: Данные спектакля или None, если он не найден
+        """
+        try:
+            self._execute_prepared("get_performance", """
+                SELECT p.*, pl.title as plot_title 
+                FROM performances p
+                JOIN plots pl ON p.plot_id = pl.plot_id
+                WHERE p.performance_id = $1
+            """, (performance_id,))
+            return self.cursor.fetchone()
+        except psycopg2.Error as e:
+            self.logger.error(f"Ошибка получения спектакля {performance_id}: {str(e)}")
+            self.connection.rollback()
+            return None
 
     def get_actors_in_performance(self, performance_id):
         """
@@ -493,11 +563,11 @@ class DatabaseManager:
             list: Список словарей с данными актеров и их ролей
         """
         try:
-            self.cursor.execute("""
+            self._execute_prepared("get_actors_in_performance", """
                 SELECT a.*, ap.role, ap.contract_cost
                 FROM actors a
                 JOIN actor_performances ap ON a.actor_id = ap.actor_id
-                WHERE ap.performance_id = %s
+                WHERE ap.performance_id = $1
                 ORDER BY ap.contract_cost DESC
             """, (performance_id,))
             return self.cursor.fetchall()
@@ -506,6 +576,28 @@ class DatabaseManager:
             self.connection.rollback()
             return []
 
+    def fetch_bundle(self):
+        """
+        Получение игровых данных, актеров и сюжетов одним запросом.
+        Списки собираются на стороне БД в JSON, массив званий приходит готовым списком.
+
+        Returns:
+            dict: Ключи game_data, actors и plots или None при ошибке
+        """
+        try:
+            self.cursor.execute("""
+                SELECT
+                    (SELECT row_to_json(g) FROM game_data g WHERE g.id = 1) AS game_data,
+                    COALESCE((SELECT json_agg(a ORDER BY a.actor_id) FROM actors a), '[]') AS actors,
+                    COALESCE((SELECT json_agg(p ORDER BY p.title) FROM plots p), '[]') AS plots
+            """)
+            row = self.cursor.fetchone()
+            return {'game_data': row['game_data'], 'actors': row['actors'], 'plots': row['plots']}
+        except psycopg2.Error as e:
+            self.logger.error(f"Ошибка получения данных театра: {str(e)}")
+            self.connection.rollback()
+            return None
+
     def get_game_data(self):
         """
         Получение игровых данных (текущий год и капитал).
@@ -514,7 +606,7 @@ class DatabaseManager:
             dict: Словарь с игровыми данными
         """
         try:
-            self.cursor.execute("SELECT * FROM game_data WHERE id = 1")
+            self._execute_prepared("get_game_data", "SELECT * FROM game_data WHERE id = 1")
             return self.cursor.fetchone()
         except psycopg2.Error as e:
             self.logger.error(f"Ошибка получения игровых данных: {str(e)}")
@@ -537,12 +629,12 @@ class DatabaseManager:
             int or None: ID добавленного сюжета или None при ошибке
         """
         try:
-            self.cursor.execute("""
+            self.scalar_cursor.execute("""
                 INSERT INTO plots (title, minimum_budget, production_cost, roles_count, demand, required_ranks)
                 VALUES (%s, %s, %s, %s, %s, %s::actor_rank[])
                 RETURNING plot_id
             """, (title, minimum_budget, production_cost, roles_count, demand, required_ranks))
-            plot_id = self.cursor.fetchone()[0]
+            plot_id = self.scalar_cursor.fetchone()[0]
             self.connection.commit()
             self.logger.info(f"Добавлен сюжет с ID {plot_id}")
             return plot_id
@@ -568,7 +660,7 @@ class DatabaseManager:
             tuple: (успех операции (bool), сообщение об ошибке (str))
         """
         try:
-            self.cursor.execute("""
+            self.scalar_cursor.execute("""
                 UPDATE plots
                 SET title = %s, minimum_budget = %s, production_cost = %s, 
                     roles_count = %s, demand = %s, required_ranks = %s::actor_rank[]
@@ -576,7 +668,7 @@ class DatabaseManager:
                 RETURNING plot_id
             """, (title, minimum_budget, production_cost, roles_count, demand, required_ranks, plot_id))
 
-            updated_id = self.cursor.fetchone()
+            updated_id = self.scalar_cursor.fetchone()
             if not updated_id:
                 self.logger.error(f"Сюжет с ID {plot_id} не найден")
                 return False, "Сюжет не найден"
@@ -600,22 +692,30 @@ class DatabaseManager:
             tuple: (успех операции (bool), сообщение об ошибке (str))
         """
         try:
-            self.cursor.execute("""
-                SELECT COUNT(*) FROM performances
-                WHERE plot_id = %s
-            """, (plot_id,))
+            # Проверки и удаление одним запросом: строка удаляется, только если обе проверки пройдены
+            self.scalar_cursor.execute("""
+                WITH checks AS (
+                    SELECT (SELECT COUNT(*) FROM performances WHERE plot_id = %(plot_id)s) AS in_use,
+                           (SELECT COUNT(*) FROM plots) AS total
+                ), deleted AS (
+                    DELETE FROM plots
+                    WHERE plot_id = %(plot_id)s
+                      AND (SELECT in_use FROM checks) = 0 AND (SELECT total FROM checks) > 5
+                    RETURNING plot_id
+                )
+                SELECT in_use, total, (SELECT COUNT(*) FROM deleted) FROM checks
+            """, {'plot_id': plot_id})
+            in_use, total, _ = self.scalar_cursor.fetchone()
+            self.connection.commit()
 
-            if self.cursor.fetchone()[0] > 0:
+            if in_use > 0:
                 self.logger.error(f"Сюжет с ID {plot_id} используется в спектаклях")
                 return False, "Сюжет используется в спектаклях и не может быть удален"
 
-            self.cursor.execute("SELECT COUNT(*) FROM plots")
-            if self.cursor.fetchone()[0] <= 5:
+            if total <= 5:
                 self.logger.error("Невозможно удалить сюжет: минимальное число сюжетов - 5")
                 return False, "Минимальное число сюжетов - 5"
 
-            self.cursor.execute("DELETE FROM plots WHERE plot_id = %s", (plot_id,))
-            self.connection.commit()
             self.logger.info(f"Удален сюжет с ID {plot_id}")
             return True, ""
         except psycopg2.Error as e:
@@ -661,18 +761,18 @@ class DatabaseManager:
             experience: Опыт работы в годах
 
         Returns:
-            int or None: ID добавленного актера или None при ошибке
+            dict or None: Добавленная запись актера или None при ошибке
         """
         try:
             self.cursor.execute("""
                 INSERT INTO actors (last_name, first_name, patronymic, rank, awards_count, experience)
                 VALUES (%s, %s, %s, %s, %s, %s)
-                RETURNING actor_id
+                RETURNING *
             """, (last_name, first_name, patronymic, rank, awards_count, experience))
-            actor_id = self.cursor.fetchone()[0]
+            actor = self.cursor.fetchone()
             self.connection.commit()
-            self.logger.info(f"Добавлен актер с ID {actor_id}")
-            return actor_id
+            self.logger.info(f"Добавлен актер с ID {actor['actor_id']}")
+            return actor
         except psycopg2.Error as e:
             self.connection.rollback()
             self.logger.error(f"Ошибка добавления актера: {str(e)}")
@@ -695,7 +795,7 @@ class DatabaseManager:
             tuple: (успех операции (bool), сообщение об ошибке (str))
         """
         try:
-            self.cursor.execute("""
+            self.scalar_cursor.execute("""
                 UPDATE actors
                 SET last_name = %s, first_name = %s, patronymic = %s, 
                     rank = %s, awards_count = %s, experience = %s
@@ -703,7 +803,7 @@ class DatabaseManager:
                 RETURNING actor_id
             """, (last_name, first_name, patronymic, rank, awards_count, experience, actor_id))
 
-            updated_id = self.cursor.fetchone()
+            updated_id = self.scalar_cursor.fetchone()
             if not updated_id:
                 self.logger.error(f"Актер с ID {actor_id} не найден")
                 return False, "Актер не найден"
@@ -727,30 +827,37 @@ class DatabaseManager:
             tuple: (успех операции (bool), сообщение об ошибке (str))
         """
         try:
-            self.cursor.execute("""
-                SELECT COUNT(*) FROM actor_performances ap
-                JOIN performances p ON ap.performance_id = p.performance_id
-                WHERE ap.actor_id = %s AND p.is_completed = FALSE
-            """, (actor_id,))
+            # Проверки, удаление ролей в завершенных спектаклях и самого актера одним запросом
+            self.scalar_cursor.execute("""
+                WITH checks AS (
+                    SELECT (SELECT COUNT(*) FROM actor_performances ap
+                            JOIN performances p ON ap.performance_id = p.performance_id
+                            WHERE ap.actor_id = %(actor_id)s AND p.is_completed = FALSE) AS busy,
+                           (SELECT COUNT(*) FROM actors) AS total
+                ), allowed AS (
+                    SELECT busy = 0 AND total > 8 AS ok FROM checks
+                ), removed_roles AS (
+                    DELETE FROM actor_performances
+                    WHERE actor_id = %(actor_id)s AND (SELECT ok FROM allowed) AND performance_id IN (
+                        SELECT performance_id FROM performances WHERE is_completed = TRUE
+                    )
+                ), deleted AS (
+                    DELETE FROM actors
+                    WHERE actor_id = %(actor_id)s AND (SELECT ok FROM allowed)
+                )
+                SELECT busy, total FROM checks
+            """, {'actor_id': actor_id})
+            busy, total = self.scalar_cursor.fetchone()
+            self.connection.commit()
 
-            if self.cursor.fetchone()[0] > 0:
+            if busy > 0:
                 self.logger.error(f"Актер с ID {actor_id} занят в текущих постановках")
                 return False, "Актер занят в текущих постановках"
 
-            self.cursor.execute("SELECT COUNT(*) FROM actors")
-            if self.cursor.fetchone()[0] <= 8:
+            if total <= 8:
                 self.logger.error("Невозможно удалить актера: минимальное число актеров - 8")
                 return False, "Минимальное число актеров - 8"
 
-            self.cursor.execute("""
-                DELETE FROM actor_performances 
-                WHERE actor_id = %s AND performance_id IN (
-                    SELECT performance_id FROM performances WHERE is_completed = TRUE
-                )
-            """, (actor_id,))
-
-            self.cursor.execute("DELETE FROM actors WHERE actor_id = %s", (actor_id,))
-            self.connection.commit()
             self.logger.info(f"Удален актер с ID {actor_id}")
             return True, ""
         except psycopg2.Error as e:
@@ -772,12 +879,12 @@ class DatabaseManager:
             int or None: ID созданного спектакля или None при ошибке
         """
         try:
-            self.cursor.execute("""
+            self.scalar_cursor.execute("""
                 INSERT INTO performances (title, plot_id, year, budget, is_completed)
                 VALUES (%s, %s, %s, %s, FALSE)
                 RETURNING performance_id
             """, (title, plot_id, year, budget))
-            performance_id = self.cursor.fetchone()[0]
+            performance_id = self.scalar_cursor.fetchone()[0]
             self.connection.commit()
             self.logger.info(f"Создан спектакль с ID {performance_id}")
             return performance_id
@@ -812,23 +919,55 @@ class DatabaseManager:
             self.logger.error(f"Ошибка назначения актера: {str(e)}")
             return False
 
-    def complete_performance(self, performance_id, revenue):
+    def _award_actors(self, actor_ids, promote_actor_id=None):
+        """
+        Запросы награждения и повышения звания без фиксации транзакции.
+        Выполняется в составе транзакции finalize_performance.
         """
-        Завершение спектакля с указанием выручки.
+        if actor_ids:
+            self.scalar_cursor.execute("""
+                UPDATE actors
+                SET awards_count = awards_count + 1
+                WHERE actor_id = ANY(%s)
+            """, (list(actor_ids),))
+            self.logger.info(f"Актерам {list(actor_ids)} присвоены награды")
+        if promote_actor_id is not None:
+            # Следующее значение перечисления; для максимального звания строка не обновляется
+            self.scalar_cursor.execute("""
+                UPDATE actors
+                SET rank = (enum_range(rank, NULL))[2]
+                WHERE actor_id = %s AND (enum_range(rank, NULL))[2] IS NOT NULL
+                RETURNING rank
+            """, (promote_actor_id,))
+            row = self.scalar_cursor.fetchone()
+            if row:
+                self.logger.info(f"Актер {promote_actor_id} повышен до звания '{row[0]}'")
+            else:
+                self.logger.info(f"Актер {promote_actor_id} уже имеет максимальное звание")
+
+    def finalize_performance(self, performance_id, budget, revenue, capital_change,
+                             awarded_actor_ids=(), promote_actor_id=None):
+        """
+        Сохранение результатов спектакля одной транзакцией: итоговый бюджет,
+        выручка и завершение, опыт и награды актеров, переход к следующему году.
 
         Args:
             performance_id: ID спектакля
+            budget: Итоговые расходы спектакля
             revenue: Полученная выручка
+            capital_change: Изменение капитала театра
+            awarded_actor_ids: ID награждаемых актеров
+            promote_actor_id: ID актера для повышения звания (опционально)
 
         Returns:
-            bool: Успешность завершения
+            bool: Успешность сохранения
         """
         try:
             self.cursor.execute("""
                 UPDATE performances
-                SET revenue = %s, is_completed = TRUE
+                SET budget = %s, revenue = %s, is_completed = TRUE
                 WHERE performance_id = %s
-            """, (revenue, performance_id))
+            """, (budget, revenue, performance_id))
 
             self.cursor.execute("""
                 UPDATE actors a
@@ -837,96 +976,20 @@ class DatabaseManager:
                 WHERE a.actor_id = ap.actor_id AND ap.performance_id = %s
             """, (performance_id,))
 
-            self.connection.commit()
-            self.logger.info(f"Спектакль {performance_id} завершен с выручкой {revenue}")
-            return True
-        except psycopg2.Error as e:
-            self.connection.rollback()
-            self.logger.error(f"Ошибка завершения спектакля: {str(e)}")
-            return False
-
-    def update_performance_budget(self, performance_id, budget):
-        """
-        Обновление бюджета спектакля.
-
-        Args:
-            performance_id: ID спектакля
-            budget: Новый бюджет
-
-        Returns:
-            bool: Успешность обновления
-        """
-        try:
             self.cursor.execute("""
-                UPDATE performances
-                SET budget = %s
-                WHERE performance_id = %s
-            """, (budget, performance_id))
-            self.connection.commit()
-            self.logger.info(f"Обновлен бюджет спектакля {performance_id}: {budget}")
-            return True
-        except psycopg2.Error as e:
-            self.connection.rollback()
-            self.logger.error(f"Ошибка обновления бюджета: {str(e)}")
-            return False
-
-    def upgrade_actor_rank(self, actor_id):
-        """
-        Повышение звания актера на одну ступень.
-
-        Args:
-            actor_id: ID актера
-
-        Returns:
-            bool: Успешность повышения
-        """
-        try:
-            self.cursor.execute("SELECT rank FROM actors WHERE actor_id = %s", (actor_id,))
-            current_rank = self.cursor.fetchone()[0]
-
-            rank_order = list(ActorRank)
-            rank_idx = [r.value for r in rank_order].index(current_rank)
-
-            if rank_idx < len(rank_order) - 1:
-                new_rank = rank_order[rank_idx + 1].value
-                self.cursor.execute("""
-                    UPDATE actors
-                    SET rank = %s
-                    WHERE actor_id = %s
-                """, (new_rank, actor_id))
-                self.connection.commit()
-                self.logger.info(f"Актер {actor_id} повышен до звания '{new_rank}'")
-                return True
-            else:
-                self.logger.info(f"Актер {actor_id} уже имеет максимальное звание")
-                return False
-        except psycopg2.Error as e:
-            self.connection.rollback()
-            self.logger.error(f"Ошибка повышения звания: {str(e)}")
-            return False
+                UPDATE game_data
+                SET current_year = current_year + 1, capital = capital + %s
+                WHERE id = 1
+            """, (capital_change,))
 
-    def award_actor(self, actor_id):
-        """
-        Присвоение награды актеру.
+            self._award_actors(awarded_actor_ids, promote_actor_id)
 
-        Args:
-            actor_id: ID актера
-
-        Returns:
-            bool: Успешность присвоения
-        """
-        try:
-            self.cursor.execute("""
-                UPDATE actors
-                SET awards_count = awards_count + 1
-                WHERE actor_id = %s
-            """, (actor_id,))
             self.connection.commit()
-            self.logger.info(f"Актеру {actor_id} присвоена награда")
+            self.logger.info(f"Спектакль {performance_id} завершен с выручкой {revenue}, расходы {budget}")
             return True
         except psycopg2.Error as e:
             self.connection.rollback()
-            self.logger.error(f"Ошибка присвоения награды: {str(e)}")
+            self.logger.error(f"Ошибка завершения спектакля: {str(e)}")
             return False
 
     # ============ Методы для TaskDialog ============
@@ -939,7 +1002,7 @@ class DatabaseManager:
             list: Список имен таблиц
         """
         try:
-            self.cursor.execute(
+            self.scalar_cursor.execute(
                 """
                 SELECT table_name 
                 FROM information_schema.tables 
@@ -949,7 +1012,7 @@ class DatabaseManager:
                 ORDER BY table_name
                 """
             )
-            return [row[0] for row in self.cursor.fetchall()]
+            return [row[0] for row in self.scalar_cursor.fetchall()]
         except psycopg2.Error as e:
             self.logger.error(f"Ошибка получения списка таблиц: {str(e)}")
             self.connection.rollback()
@@ -966,7 +1029,7 @@ class DatabaseManager:
             list: Список словарей с информацией о столбцах
         """
         try:
-            self.cursor.execute(
+            self.scalar_cursor.execute(
                 """
                 SELECT 
                     column_name, 
@@ -982,7 +1045,7 @@ class DatabaseManager:
             )
 
             columns = []
-            for row in self.cursor.fetchall():
+            for row in self.scalar_cursor.fetchall():
                 columns.append({
                     'name': row[0],
                     'type': row[1],
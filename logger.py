@@ -34,8 +34,8 @@ class Logger(QObject):
 
         super().__init__()
         self.logger = logging.getLogger(__name__)
+        # Записи передаются в интерфейс только через сигнал; логгер не обращается к виджетам
         self.emitter = LogEmitter()
-        self._main_window_log_display = None
         self._initialized = True
 
         # Очистка старых обработчиков если они есть
@@ -56,23 +56,6 @@ class Logger(QObject):
         file_handler.setFormatter(formatter)
         self.logger.addHandler(file_handler)
 
-    def set_main_window_log_display(self, log_display):
-        """Связывает текстовое поле в главном окне с логгером для отображения логов."""
-        self._main_window_log_display = log_display
-        self.emitter.new_log.connect(self._update_log_display)
-        # Прокрутка вниз для показа последних логов
-        if self._main_window_log_display:
-            scrollbar = self._main_window_log_display.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
-
-    def _update_log_display(self, message):
-        """Обновляет отображение логов в интерфейсе пользователя."""
-        if self._main_window_log_display:
-            self._main_window_log_display.append(message)
-            # Прокручивание до самых новых сообщений
-            scrollbar = self._main_window_log_display.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
-
     def info(self, message):
         """Запись информационного сообщения в лог."""
         self.logger.info(message)
@@ -7,6 +7,7 @@ from PySide6.QtWidgets import QApplication
 from mainwindow import MainWindow
 from login_d import LoginDialog
 from logger import Logger
+from styles import load_app_stylesheet
 
 if __name__ == "__main__":
     # Инициализация логгера
@@ -16,6 +17,8 @@ if __name__ == "__main__":
     # Создание и настройка приложения Qt
     app = QApplication(sys.argv)
     app.setApplicationName("Театральный менеджер")
+    # Единая таблица стилей для всех окон приложения
+    app.setStyleSheet(load_app_stylesheet())
 
     # Показ диалога авторизации
     login_dialog = LoginDialog()
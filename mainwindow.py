@@ -6,16 +6,22 @@ import sys
 from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton, QLabel, QVBoxLayout,
                                QHBoxLayout, QWidget, QMessageBox, QTabWidget, QTextEdit)
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont
 
-from controller import TheaterController
+from controller import TheaterController, format_rub
 from logger import Logger
+from styles import TITLE_FONT_24, INFO_FONT_14
 from new_performance_d import NewPerformanceDialog
 from performance_d import PerformanceHistoryDialog, PerformanceDetailsDialog
 from plot_d import PlotManagementDialog
 from actor_d import ActorsManagementDialog
 from task_d import TaskDialog
 
+# Объем конца лог-файла, загружаемого при открытии окна, и предел строк в окне логов
+_LOG_TAIL_BYTES = 256 * 1024
+_LOG_MAX_LINES = 5000
+# Интервал, за который сообщения лога накапливаются и выводятся одной вставкой (мс)
+_LOG_FLUSH_INTERVAL = 50
+
 
 class MainWindow(QMainWindow):
     """
@@ -28,12 +34,22 @@ class MainWindow(QMainWindow):
         self.controller = controller
         self.logger = Logger()
 
+        # Диалоги создаются при первом открытии и используются повторно
+        self._new_show_dialog = None
+        self._history_dialog = None
+        self._actors_dialog = None
+
+        # Буфер сообщений лога, ожидающих вывода в окно
+        self._log_buffer = []
+        self._log_flush_pending = False
+
+        # Последние показанные тексты меток года и капитала
+        self._last_year = None
+        self._last_capital = None
+
         self.setWindowTitle("Театральный менеджер")
         self.setMinimumSize(1100, 700)
 
-        # Установка стилей для всего приложения
-        self.set_application_style()
-
         # Инициализация интерфейса
         self.setup_ui()
 
@@ -53,21 +69,20 @@ class MainWindow(QMainWindow):
         # Заголовок
         title_label = QLabel("Театральный менеджер")
         title_label.setAlignment(Qt.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #2a66c8; margin: 10px;")
+        title_label.setFont(TITLE_FONT_24)
+        title_label.setObjectName("mainTitle")
         main_layout.addWidget(title_label)
 
         # Информационная панель
         self.info_layout = QHBoxLayout()
         self.year_label = QLabel("Текущий год: ")
         self.capital_label = QLabel("Капитал: ")
-        info_font = QFont()
-        info_font.setPointSize(14)
-        self.year_label.setFont(info_font)
-        self.capital_label.setFont(info_font)
+        self.year_label.setFont(INFO_FONT_14)
+        self.capital_label.setFont(INFO_FONT_14)
+        # Фиксированная ширина: смена текста не вызывает пересчета информационной панели
+        self.year_label.setFixedWidth(220)
+        self.capital_label.setFixedWidth(260)
+        self.capital_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         self.info_layout.addWidget(self.year_label)
         self.info_layout.addStretch()
         self.info_layout.addWidget(self.capital_label)
@@ -90,7 +105,7 @@ class MainWindow(QMainWindow):
         """
         instruction_label = QLabel(instruction_text)
         instruction_label.setWordWrap(True)
-        instruction_label.setStyleSheet("background-color: #f0f0f0; padding: 15px; border-radius: 5px;")
+        instruction_label.setObjectName("instructionLabel")
         main_layout.addWidget(instruction_label)
 
         # Создание вкладок для логов и других данных
@@ -102,13 +117,16 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout(log_tab)
         self.log_display = QTextEdit()
         self.log_display.setReadOnly(True)
-        self.log_display.setStyleSheet("background-color: white; color: black; ")
+        # Старые строки отбрасываются автоматически при превышении предела
+        self.log_display.document().setMaximumBlockCount(_LOG_MAX_LINES)
+        self.log_display.setObjectName("logDisplay")
         log_layout.addWidget(self.log_display)
         self.data_tabs.addTab(log_tab, "Логи")
         self.data_tabs.setCurrentIndex(0)
 
-        # Регистрация дисплея логов в логгере
-        self.logger.set_main_window_log_display(self.log_display)
+        # Новые записи логгера выводятся в окно пакетами; соединение очередное,
+        # поэтому записи из рабочих потоков обрабатываются в главном потоке
+        self.logger.emitter.new_log.connect(self.append_log, Qt.QueuedConnection)
 
         # Кнопка отключения от БД
         disconnect_btn_layout = QHBoxLayout()
@@ -167,11 +185,18 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(buttons_layout)
 
     def load_logs(self):
-        """Загрузка содержимого лог-файла в окно логов."""
+        """Загрузка последних записей лог-файла в окно логов."""
         try:
-            with open("app.log", "r", encoding="utf-8") as f:
-                log_content = f.read()
-                self.log_display.setText(log_content)
+            # Читается только конец файла: время загрузки не зависит от размера лога
+            with open("app.log", "rb") as f:
+                f.seek(0, 2)
+                size = f.tell()
+                f.seek(max(0, size - _LOG_TAIL_BYTES))
+                log_content = f.read().decode("utf-8", "replace")
+            # Первая строка может быть обрезана посередине
+            if size > _LOG_TAIL_BYTES:
+                log_content = log_content.split("\n", 1)[-1]
+            self.log_display.setPlainText(log_content)
 
             # Прокрутка к последней записи
             QTimer.singleShot(100, lambda: self.log_display.verticalScrollBar().setValue(
@@ -180,148 +205,25 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Ошибка загрузки логов: {str(e)}")
 
     def append_log(self, message):
-        """Добавление сообщения в окно логов с прокруткой вниз."""
-        if hasattr(self, 'log_display') and self.log_display is not None:
-            self.log_display.append(message)
-            # Прокрутка вниз для отображения новых сообщений
-            scrollbar = self.log_display.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
-
-    def set_application_style(self):
-        """Установка единого стиля для всего приложения."""
-        app_style = """
-        QMainWindow, QDialog {
-            background-color: #f5f5f5;
-        }
-        QPushButton {
-            background-color: #4a86e8;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            padding: 8px 16px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #3a76d8;
-        }
-        QPushButton:pressed {
-            background-color: #2a66c8;
-        }
-        QLabel {
-            color: #333333;
-        }
-        QTableWidget {
-            border: 1px solid #d0d0d0;
-            gridline-color: #e0e0e0;
-        }
-        QTableWidget::item:selected {
-            background-color: #d0e8ff;
-        }
-        QHeaderView::section {
-            background-color: #e0e0e0;
-            color: #333333;
-            padding: 4px;
-            border: 1px solid #c0c0c0;
-            font-weight: bold;
-        }
-        QTabWidget::pane {
-            border: 1px solid #c0c0c0;
-            background-color: white;
-        }
-        QTabBar::tab {
-            background-color: #e0e0e0;
-            color: #333333;
-            padding: 8px 12px;
-            border: 1px solid #c0c0c0;
-            border-bottom: none;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        QTabBar::tab:selected {
-            background-color: white;
-            font-weight: bold;
-        }
-        QComboBox {
-            background-color: white;
-            color: #333333;
-            border: 1px solid #c0c0c0;
-            border-radius: 4px;
-            padding: 6px;
-            min-height: 25px;
-        }
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 20px;
-            border-left: 1px solid #c0c0c0;
-            border-top-right-radius: 4px;
-            border-bottom-right-radius: 4px;
-        }
-        QComboBox::down-arrow {
-            image: none;
-            width: 10px;
-            height: 10px;
-            background: #4a86e8;
-            border-radius: 5px;
-        }
-        QComboBox QAbstractItemView {
-            border: 1px solid #c0c0c0;
-            border-radius: 4px;
-            background-color: white;
-            color: #333333;
-            selection-background-color: #d0e8ff;
-            selection-color: #333333;
-            padding: 4px;
-        }
-        QLineEdit {
-            background-color: white;
-            color: #333333;
-            border: 1px solid #c0c0c0;
-            padding: 4px;
-            min-width: 120px;
-        }
-        QTextEdit {
-            border: 1px solid #c0c0c0;
-            padding: 2px;
-        }
-        QSpinBox {
-            background-color: white;
-            color: #333333;
-            border: 1px solid #c0c0c0;
-            border-radius: 4px;
-            padding: 1px 1px 1px 4px;
-            min-width: 80px;
-            max-height: 22px;
-        }
-        QSpinBox::up-button, QSpinBox::down-button {
-            background-color: #e8e8e8;
-            width: 16px;
-            border: none;
-            border-left: 1px solid #c0c0c0;
-        }
-        QSpinBox::up-button {
-            border-top-right-radius: 3px;
-            border-bottom: 1px solid #c0c0c0;
-        }
-        QSpinBox::down-button {
-            border-bottom-right-radius: 3px;
-        }
-        QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-            background-color: #d0e8ff;
-        }
-        QSpinBox::up-button:pressed, QSpinBox::down-button:pressed {
-            background-color: #4a86e8;
-        }
-        QSpinBox::up-arrow, QSpinBox::down-arrow {
-            width: 6px;
-            height: 6px;
-            background: #4a86e8;
-        }
-        QSpinBox:focus {
-            border: 1px solid #4a86e8;
-        }
         """
-        self.setStyleSheet(app_style)
+        Постановка сообщения в очередь вывода в окно логов.
+        Сообщения, пришедшие за интервал _LOG_FLUSH_INTERVAL, выводятся одной вставкой.
+        """
+        self._log_buffer.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(_LOG_FLUSH_INTERVAL, self, self._flush_logs)
+
+    def _flush_logs(self):
+        """Вывод накопленных сообщений в окно логов с прокруткой вниз."""
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
+        self.log_display.append("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+        # Прокрутка вниз для отображения новых сообщений
+        scrollbar = self.log_display.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
 
     def update_game_info(self):
         """Обновление информации о текущем годе и капитале в интерфейсе."""
@@ -329,18 +231,25 @@ class MainWindow(QMainWindow):
             game_data = self.controller.get_game_state()
 
             if game_data and 'current_year' in game_data and 'capital' in game_data:
-                self.year_label.setText(f"Текущий год: {game_data['current_year']}")
                 # Форматирование числа с разделителями тысяч
-                self.capital_label.setText(f"Капитал: {game_data['capital']:,} ₽".replace(',', ' '))
+                self._set_game_info(f"Текущий год: {game_data['current_year']}",
+                                    f"Капитал: {format_rub(game_data['capital'])}")
             else:
                 # Если данных нет, пробуем инициализировать их
-                self.year_label.setText("Текущий год: -")
-                self.capital_label.setText("Капитал: -")
+                self._set_game_info("Текущий год: -", "Капитал: -")
 
         except Exception as e:
             self.logger.error(f"Ошибка при обновлении информации: {str(e)}")
-            self.year_label.setText("Текущий год: -")
-            self.capital_label.setText("Капитал: -")
+            self._set_game_info("Текущий год: -", "Капитал: -")
+
+    def _set_game_info(self, year_text, capital_text):
+        """Обновление меток года и капитала только при изменении их текста."""
+        if year_text != self._last_year:
+            self._last_year = year_text
+            self.year_label.setText(year_text)
+        if capital_text != self._last_capital:
+            self._last_capital = capital_text
+            self.capital_label.setText(capital_text)
 
     def reset_database(self):
         """Сброс данных базы данных к начальному состоянию."""
@@ -385,8 +294,11 @@ class MainWindow(QMainWindow):
     def open_new_show_dialog(self):
         """Открытие диалога создания новой постановки."""
         try:
-            dialog = NewPerformanceDialog(self.controller, self)
-            if dialog.exec():
+            if self._new_show_dialog is None:
+                self._new_show_dialog = NewPerformanceDialog(self.controller, self)
+            else:
+                self._new_show_dialog.reset()
+            if self._new_show_dialog.exec():
                 self.update_game_info()
         except Exception as e:
             err_box = QMessageBox(self)
@@ -397,8 +309,11 @@ class MainWindow(QMainWindow):
 
     def show_history(self):
         """Просмотр истории постановок."""
-        history_dialog = PerformanceHistoryDialog(self.controller, self)
-        history_dialog.exec()
+        if self._history_dialog is None:
+            self._history_dialog = PerformanceHistoryDialog(self.controller, self)
+        else:
+            self._history_dialog.reset()
+        self._history_dialog.exec()
 
     def show_performance_details(self, performance_id):
         """Просмотр детальной информации о постановке."""
@@ -422,8 +337,11 @@ class MainWindow(QMainWindow):
 
     def manage_actors(self):
         """Открытие диалога управления актерами."""
-        dialog = ActorsManagementDialog(self.controller, self)
-        if dialog.exec():
+        if self._actors_dialog is None:
+            self._actors_dialog = ActorsManagementDialog(self.controller, self)
+        else:
+            self._actors_dialog.reset()
+        if self._actors_dialog.exec():
             self.update_game_info()
 
     def open_task_dialog(self):
@@ -452,8 +370,8 @@ class MainWindow(QMainWindow):
                     self,
                     "Год пропущен",
                     f"Вы пропустили год. Сейчас {skip_result['year']} год.\n\n"
-                    f"Театр получил {skip_result['rights_sale']:,} ₽ за продажу прав на постановку.".replace(',',
-                                                                                                             ' ')
+                    f"Театр получил {format_rub(skip_result['rights_sale'])} "
+                    f"за продажу прав на постановку."
                 )
                 self.update_game_info()
         else:
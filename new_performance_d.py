@@ -1,12 +1,50 @@
 """
 Модуль диалога создания новой постановки для приложения "Театральный менеджер".
 """
+from collections import namedtuple
+
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QFormLayout,
                               QComboBox, QSpinBox, QPushButton, QScrollArea,
-                              QFrame, QMessageBox, QLineEdit, QWidget)
-from PySide6.QtCore import Qt
+                              QFrame, QMessageBox, QWidget)
+from PySide6.QtCore import Qt, QSignalBlocker, QSortFilterProxyModel, QTimer
+from PySide6.QtGui import QStandardItemModel, QStandardItem
+
+from controller import TheaterController, ValidatedLineEdit, format_rub, RANK_ORDER, RANK_INDEX
+from actor_d import Actor
+
+# Запись сюжета; строки БД преобразуются в нее один раз при загрузке диалога
+Plot = namedtuple('Plot', 'plot_id title minimum_budget production_cost roles_count demand required_ranks')
+
+# Столбец 0 общей модели актеров - без требований к званию,
+# столбец k - с требованием не ниже RANK_ORDER[k - 1]
+_RANK_COLUMNS = len(RANK_ORDER) + 1
+
+# Задержка пересчета оставшегося бюджета после изменения значений (мс)
+_BUDGET_UPDATE_DELAY = 80
+
+
+class ActorChoiceProxyModel(QSortFilterProxyModel):
+    """
+    Прокси общего списка актеров для выпадающего списка одной роли.
+    Скрывает актеров, выбранных для других ролей.
+    """
+
+    def __init__(self, selected_actor_ids, parent=None):
+        super().__init__(parent)
+        # Общее для всех ролей множество занятых актеров
+        self._selected_actor_ids = selected_actor_ids
+        self.own_actor_id = None
+
+    def refilter(self, own_actor_id):
+        """Повторная фильтрация после изменения выбора актеров."""
+        self.beginFilterChange()
+        self.own_actor_id = own_actor_id
+        self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
 
-from controller import TheaterController, ValidatedLineEdit
+    def filterAcceptsRow(self, source_row, source_parent):
+        actor_id = self.sourceModel().index(source_row, 0, source_parent).data(Qt.UserRole)
+        return (actor_id is None or actor_id == self.own_actor_id
+                or actor_id not in self._selected_actor_ids)
 
 
 class NewPerformanceDialog(QDialog):
@@ -18,14 +56,42 @@ class NewPerformanceDialog(QDialog):
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
-        self.game_data = controller.get_game_state()
-        self.all_plots = controller.get_all_plots()
-        self.all_actors = controller.get_all_actors()
+        self.game_data = None
+        self.all_plots = []
+        self.all_actors = []
+        self._plot_by_id = {}
+        self._actor_by_id = {}
+        self._current_min_ranks = []
+
+        # Пул созданных рамок ролей и рамки ролей текущего сюжета в порядке отображения
+        self._role_frame_pool = []
+        self._role_frames = []
+
+        # Оставшийся бюджет, рассчитанный при последнем обновлении
+        self._remaining_budget = 0
+
+        # Признак запланированного обновления списков актеров
+        self._update_pending = False
+
+        # Таймер пересчета оставшегося бюджета: серия изменений бюджета или
+        # выбора актеров приводит к одному пересчету
+        self._budget_timer = QTimer(self)
+        self._budget_timer.setSingleShot(True)
+        self._budget_timer.setInterval(_BUDGET_UPDATE_DELAY)
+        self._budget_timer.timeout.connect(self._do_update_remaining_budget)
+
+        # Модель списка сюжетов
+        self._plot_model = QStandardItemModel(self)
+
+        # Общая модель актеров для списков выбора всех ролей и множество занятых актеров
+        self._actor_model = QStandardItemModel(self)
+        self._selected_actor_ids = set()
 
         self.setWindowTitle("Новая постановка")
         self.setMinimumSize(800, 600)
 
         self.setup_ui()
+        self.reset()
 
     def setup_ui(self):
         """Настройка пользовательского интерфейса диалога."""
@@ -40,9 +106,7 @@ class NewPerformanceDialog(QDialog):
 
         # Выбор сюжета
         self.plot_combo = QComboBox()
-        for plot in self.all_plots:
-            self.plot_combo.addItem(f"{plot['title']} (мин. бюджет: {plot['minimum_budget']:,} ₽)".replace(',', ' '),
-                                    plot['plot_id'])
+        self.plot_combo.setModel(self._plot_model)
         self.plot_combo.currentIndexChanged.connect(self.update_roles_section)
         form_layout.addRow("Сюжет:", self.plot_combo)
 
@@ -52,39 +116,43 @@ class NewPerformanceDialog(QDialog):
         form_layout.addRow(self.plot_info)
 
         # Год постановки (текущий)
-        self.year_label = QLabel(f"{self.game_data['current_year']}")
+        self.year_label = QLabel()
         form_layout.addRow("Год постановки:", self.year_label)
 
         # Бюджет спектакля
         self.budget_spin = QSpinBox()
-        # Установка максимального значения равным капиталу театра
-        self.budget_spin.setRange(100000, self.game_data['capital'])
         self.budget_spin.setSingleStep(50000)
-        self.budget_spin.setValue(min(500000, self.game_data['capital']))  # Не превышаем капитал
         self.budget_spin.setPrefix("₽ ")
         self.budget_spin.valueChanged.connect(self.update_remaining_budget)
         form_layout.addRow("Бюджет спектакля:", self.budget_spin)
 
         # Доступный капитал
-        self.capital_label = QLabel(f"{self.game_data['capital']:,} ₽".replace(',', ' '))
+        self.capital_label = QLabel()
         form_layout.addRow("Доступный капитал:", self.capital_label)
 
         # Оставшийся бюджет
         self.remaining_budget_label = QLabel()
         form_layout.addRow("Оставшийся бюджет:", self.remaining_budget_label)
 
-        main_layout.addLayout(form_layout)
+        # Форма и секция ролей прокручиваются вместе в одной области,
+        # кнопки действий остаются под ней
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        content_layout.addLayout(form_layout)
 
         # Секция выбора актеров
-        main_layout.addWidget(QLabel("<h3>Выбор актеров для ролей</h3>"))
+        content_layout.addWidget(QLabel("<h3>Выбор актеров для ролей</h3>"))
 
-        # Контейнер для ролей с прокруткой
+        # Контейнер для ролей
         self.roles_widget = QWidget()
         self.roles_layout = QVBoxLayout(self.roles_widget)
+        self.roles_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.addWidget(self.roles_widget)
+        content_layout.addStretch()
 
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.roles_widget)
+        scroll_area.setWidget(content_widget)
 
         main_layout.addWidget(scroll_area)
 
@@ -101,13 +169,71 @@ class NewPerformanceDialog(QDialog):
 
         main_layout.addLayout(buttons_layout)
 
+    def reset(self):
+        """
+        Загрузка актуальных данных и сброс введенных значений.
+        Вызывается при создании диалога и перед каждым повторным открытием.
+        """
+        bundle = self.controller.get_refresh_bundle()
+        self.game_data = bundle['game_state']
+        self.all_plots = [Plot._make(row[f] for f in Plot._fields) for row in bundle['plots']]
+        self.all_actors = [Actor._make(row[f] for f in Actor._fields) for row in bundle['actors']]
+
+        # Индексы по ID
+        self._plot_by_id = {p.plot_id: p for p in self.all_plots}
+        self._actor_by_id = {a.actor_id: a for a in self.all_actors}
+
+        # Общая модель актеров заполняется один раз; списки ролей только фильтруют ее
+        self._actor_model.clear()
+        # Каждый столбец содержит тот же список, но со своими подсказками о несоответствии
+        # званию; список роли показывает столбец, соответствующий ее минимальному званию
+        self._actor_model.appendRow([QStandardItem("Выберите актера") for _ in range(_RANK_COLUMNS)])
+        for a in self.all_actors:
+            actor_name = f"{a.last_name} {a.first_name} {a.patronymic} ({a.rank})"
+            # Первый столбец, требование которого актер не выполняет (неизвестное звание - ни один)
+            rank_index = RANK_INDEX.get(a.rank)
+            first_unmet_column = rank_index + 2 if rank_index is not None else _RANK_COLUMNS
+            row = []
+            for column in range(_RANK_COLUMNS):
+                item = QStandardItem(actor_name)
+                item.setData(a.actor_id, Qt.UserRole)
+                if column >= first_unmet_column:
+                    item.setToolTip("Не соответствует требованиям звания")
+                row.append(item)
+            self._actor_model.appendRow(row)
+
+        self.title_edit.clear()
+
+        # Список сюжетов заполняется одной вставкой в модель и без сигналов:
+        # секция ролей строится один раз ниже
+        plot_items = []
+        for plot in self.all_plots:
+            item = QStandardItem(f"{plot.title} (мин. бюджет: {format_rub(plot.minimum_budget)})")
+            item.setData(plot.plot_id, Qt.UserRole)
+            plot_items.append(item)
+
+        blocker = QSignalBlocker(self.plot_combo)
+        self._plot_model.clear()
+        self._plot_model.invisibleRootItem().appendRows(plot_items)
+        self.plot_combo.setCurrentIndex(0)
+        blocker.unblock()
+
+        # Год постановки и доступный капитал
+        self.year_label.setText(f"{self.game_data['current_year']}")
+        self.capital_label.setText(format_rub(self.game_data['capital']))
+
+        # Установка максимального значения бюджета равным капиталу театра
+        self.budget_spin.setRange(100000, self.game_data['capital'])
+        self.budget_spin.setValue(min(500000, self.game_data['capital']))  # Не превышаем капитал
+
         # Инициализация данных
         self.update_roles_section(0)
-        self.update_remaining_budget()
+        self._do_update_remaining_budget()
 
     def calculate_contract_cost(self, actor):
         """Расчет стоимости контракта для актера."""
-        return self.controller.calculate_contract_cost(actor)
+        # Контроллер работает со словарями, как и остальные данные из БД
+        return self.controller.calculate_contract_cost(actor._asdict())
 
     def update_roles_section(self, index):
         """Обновление секции с ролями в зависимости от выбранного сюжета."""
@@ -116,7 +242,7 @@ class NewPerformanceDialog(QDialog):
 
         # Получение данных выбранного сюжета
         plot_id = self.plot_combo.currentData()
-        plot = next((p for p in self.all_plots if p['plot_id'] == plot_id), None)
+        plot = self._plot_by_id.get(plot_id)
 
         if not plot:
             return
@@ -124,23 +250,26 @@ class NewPerformanceDialog(QDialog):
         # Обновление информации о сюжете
         self.plot_info.setText(
             f"<b>Информация о сюжете:</b><br>"
-            f"Минимальный бюджет: {plot['minimum_budget']:,} ₽<br>"
-            f"Стоимость постановки: {plot['production_cost']:,} ₽<br>"
-            f"Количество ролей: {plot['roles_count']}<br>"
-            f"Спрос: {plot['demand']}/10"
+            f"Минимальный бюджет: {format_rub(plot.minimum_budget)}<br>"
+            f"Стоимость постановки: {format_rub(plot.production_cost)}<br>"
+            f"Количество ролей: {plot.roles_count}<br>"
+            f"Спрос: {plot.demand}/10"
         )
         self.plot_info.setStyleSheet("background-color: #f0f0f0; padding: 10px; border-radius: 5px;")
 
+        # Минимальные звания ролей разбираются один раз на выбор сюжета
+        self._current_min_ranks = plot.required_ranks
+
         # Установка минимального бюджета с учетом капитала
-        min_budget = max(100000, plot['minimum_budget'])
+        min_budget = max(100000, plot.minimum_budget)
         # Убедимся, что максимальный бюджет не превышает доступный капитал
         max_budget = self.game_data['capital']
 
         # Проверка, достаточно ли капитала для минимального бюджета
         if min_budget > max_budget:
             QMessageBox.warning(self, "Недостаточно средств",
-                                f"Для постановки этого сюжета требуется минимум {min_budget:,} ₽, "
-                                f"но доступный капитал составляет только {max_budget:,} ₽.")
+                                f"Для постановки этого сюжета требуется минимум {format_rub(min_budget)}, "
+                                f"но доступный капитал составляет только {format_rub(max_budget)}.")
             # Если недостаточно средств, можно выбрать другой сюжет или отменить
             self.budget_spin.setRange(min_budget, min_budget)  # Ограничиваем ввод
         else:
@@ -153,195 +282,186 @@ class NewPerformanceDialog(QDialog):
         elif current_value > max_budget:
             self.budget_spin.setValue(max_budget)
 
-        # Очистка предыдущих ролей
-        for i in reversed(range(self.roles_layout.count())):
-            widget = self.roles_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-        # Порядок званий для сравнения
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
-
-        # Функция обновления списков актеров для всех ролей
-        def update_actor_lists():
-            # Сбор занятых актеров
-            selected_actors = set()
-            for i in range(self.roles_layout.count()):
-                role_frame = self.roles_layout.itemAt(i).widget()
-                if role_frame:
-                    for child in role_frame.children():
-                        if isinstance(child, QComboBox):
-                            actor_id = child.currentData()
-                            if actor_id:
-                                selected_actors.add(actor_id)
-
-            # Обновление списков актеров для каждой роли
-            for i in range(self.roles_layout.count()):
-                role_frame = self.roles_layout.itemAt(i).widget()
-                if role_frame:
-                    for child in role_frame.children():
-                        if isinstance(child, QComboBox):
-                            current_actor = child.currentData()
-                            child.blockSignals(True)
-                            current_index = child.currentIndex()
-                            child.clear()
-                            child.addItem("Выберите актера", None)
-
-                            # Добавление актеров, которые не заняты или выбраны для текущей роли
-                            for actor in self.all_actors:
-                                if actor['actor_id'] == current_actor or actor['actor_id'] not in selected_actors:
-                                    actor_name = f"{actor['last_name']} {actor['first_name']} {actor['patronymic']} ({actor['rank']})"
-                                    child.addItem(actor_name, actor['actor_id'])
-
-                                    # Выбор текущего актера, если он был выбран ранее
-                                    if actor['actor_id'] == current_actor:
-                                        child.setCurrentIndex(child.count() - 1)
-
-                                    # Проверка требований к званию для роли
-                                    required_ranks = plot['required_ranks'] if 'required_ranks' in plot else []
-                                    role_index = self.roles_layout.indexOf(role_frame)
-
-                                    # Получение минимального звания для текущей роли
-                                    min_rank = None
-                                    if role_index < len(required_ranks):
-                                        if isinstance(required_ranks, str) and required_ranks.startswith(
-                                                '{') and required_ranks.endswith('}'):
-                                            required_ranks_list = required_ranks[1:-1].split(',')
-                                            min_rank = required_ranks_list[role_index] if role_index < len(
-                                                required_ranks_list) else None
-                                        elif isinstance(required_ranks, list):
-                                            min_rank = required_ranks[role_index]
-
-                                        # Очистка кавычек, если они есть
-                                        if min_rank and min_rank.startswith('"') and min_rank.endswith('"'):
-                                            min_rank = min_rank[1:-1]
-
-                                    # Предупреждение, если актер не соответствует требованиям
-                                    if min_rank and min_rank in rank_order and actor['rank'] in rank_order:
-                                        if rank_order.index(actor['rank']) < rank_order.index(min_rank):
-                                            idx = child.count() - 1
-                                            child.setItemData(idx, "Не соответствует требованиям звания",
-                                                              Qt.ToolTipRole)
-
-                            child.blockSignals(False)
-
-            # Обновление оставшегося бюджета
-            self.update_remaining_budget()
-
-        # Создание полей для каждой роли
-        for i in range(plot['roles_count']):
-            role_frame = QFrame()
-            role_frame.setFrameStyle(QFrame.StyledPanel | QFrame.Sunken)
-            role_frame.setProperty("contract_cost", 0)
-            role_layout = QHBoxLayout(role_frame)
-
-            # Поле для названия роли
-            role_name = ValidatedLineEdit(self.controller)
-            role_name.setPlaceholderText(f"Роль {i + 1}")
-            role_name.setMinimumWidth(180)
-            role_name.setStyleSheet("color: black;")
-
-            # Выпадающий список для выбора актера
-            actor_combo = QComboBox()
-            actor_combo.addItem("Выберите актера", None)
-
-            # Функция для обработки выбора актера
-            def create_actor_selected_handler(frame, label):
-                def on_actor_selected(index):
-                    combo = frame.findChild(QComboBox)
-                    actor_id = combo.currentData()
-                    if actor_id:
-                        actor = next((a for a in self.all_actors if a['actor_id'] == actor_id), None)
-                        if actor:
-                            # Расчет стоимости контракта
-                            costs = self.calculate_contract_cost(actor)
-                            label.setText(
-                                f"<b>Контракт:</b> {costs['contract']:,} ₽<br>"
-                                f"<b>Премия:</b> {costs['premium']:,} ₽<br>"
-                                f"<b>Итого:</b> {costs['total']:,} ₽".replace(',', ' ')
-                            )
-                            frame.setProperty("contract_cost", costs['total'])
-                    else:
-                        label.setText("<b>Контракт:</b> — ₽")
-                        frame.setProperty("contract_cost", 0)
-
-                    # Обновление списков актеров
-                    update_actor_lists()
-
-                return on_actor_selected
-
-            # Метка для отображения стоимости контракта
-            contract_label = QLabel("<b>Контракт:</b> — ₽")
-            contract_label.setWordWrap(True)
-            contract_label.setStyleSheet("color: white;")
-
-            # Подключение обработчика выбора актера
-            actor_combo.currentIndexChanged.connect(create_actor_selected_handler(role_frame, contract_label))
-
-            # Метки для полей
-            role_label = QLabel(f"Роль {i + 1}:")
-            role_label.setStyleSheet("color: white;")
-            actor_label = QLabel("Актер:")
-            actor_label.setStyleSheet("color: white;")
-
-            # Добавление полей в макет
-            role_layout.addWidget(role_label)
-            role_layout.addWidget(role_name, 2)
-            role_layout.addWidget(actor_label)
-            role_layout.addWidget(actor_combo, 3)
-            role_layout.addWidget(contract_label, 2)
-
-            # Добавление требований к званию, если они есть
-            required_ranks = plot['required_ranks'] if 'required_ranks' in plot else []
-            min_rank = None
-            if i < len(required_ranks):
-                if isinstance(required_ranks, str) and required_ranks.startswith('{') and required_ranks.endswith('}'):
-                    required_ranks_list = required_ranks[1:-1].split(',')
-                    min_rank = required_ranks_list[i] if i < len(required_ranks_list) else None
-                elif isinstance(required_ranks, list):
-                    min_rank = required_ranks[i]
-
-                # Очистка кавычек, если они есть
-                if min_rank and min_rank.startswith('"') and min_rank.endswith('"'):
-                    min_rank = min_rank[1:-1]
-
-            # Отображение минимального звания для роли
-            if min_rank and min_rank in rank_order:
-                rank_label = QLabel(f"Мин. звание: {min_rank}")
-                rank_label.setStyleSheet("color: red; font-weight: bold;")
-                role_layout.addWidget(rank_label)
-
-            # Добавление рамки с полями роли в макет
-            self.roles_layout.addWidget(role_frame)
+        # Рамки ролей берутся из пула: недостающие создаются, лишние скрываются,
+        # поэтому смена сюжета не пересоздает виджеты
+        roles_count = plot.roles_count
+        while len(self._role_frame_pool) < roles_count:
+            self._role_frame_pool.append(self._create_role_frame(len(self._role_frame_pool)))
+        self._role_frames = self._role_frame_pool[:roles_count]
+
+        for i, role_frame in enumerate(self._role_frame_pool):
+            # Минимальное звание для роли
+            min_rank = self._current_min_ranks[i] if i < len(self._current_min_ranks) else None
+            self._reset_role_frame(role_frame, min_rank)
+            role_frame.setVisible(i < roles_count)
 
         # Обновление списков актеров
-        update_actor_lists()
+        self._do_update_actor_lists()
+
+    def _create_role_frame(self, i):
+        """Создание рамки с полями роли с порядковым номером i."""
+        role_frame = QFrame()
+        role_frame.setFrameStyle(QFrame.StyledPanel | QFrame.Sunken)
+        # Стоимость контракта выбранного актера
+        role_frame._contract_cost = 0
+        role_layout = QHBoxLayout(role_frame)
+
+        # Поле для названия роли
+        role_name = ValidatedLineEdit(self.controller)
+        role_name.setPlaceholderText(f"Роль {i + 1}")
+        role_name.setMinimumWidth(180)
+        role_name.setStyleSheet("color: black;")
+
+        # Выпадающий список для выбора актера
+        actor_proxy = ActorChoiceProxyModel(self._selected_actor_ids, role_frame)
+        actor_proxy.setSourceModel(self._actor_model)
+        actor_combo = QComboBox()
+        actor_combo.setModel(actor_proxy)
+
+        # Метка для отображения стоимости контракта
+        contract_label = QLabel("<b>Контракт:</b> — ₽")
+        contract_label.setWordWrap(True)
+        contract_label.setStyleSheet("color: white;")
+
+        # Метка минимального звания, показывается только при наличии требования
+        rank_label = QLabel()
+        rank_label.setStyleSheet("color: red; font-weight: bold;")
+
+        # Прямые ссылки на поля роли
+        role_frame._name_edit = role_name
+        role_frame._actor_combo = actor_combo
+        role_frame._contract_label = contract_label
+        role_frame._rank_label = rank_label
+
+        # Функция для обработки выбора актера
+        def on_actor_selected(index):
+            actor_id = actor_combo.currentData()
+            if actor_id:
+                actor = self._actor_by_id.get(actor_id)
+                if actor:
+                    # Расчет стоимости контракта
+                    costs = self.calculate_contract_cost(actor)
+                    contract_label.setText(
+                        f"<b>Контракт:</b> {format_rub(costs['contract'])}<br>"
+                        f"<b>Премия:</b> {format_rub(costs['premium'])}<br>"
+                        f"<b>Итого:</b> {format_rub(costs['total'])}"
+                    )
+                    role_frame._contract_cost = costs['total']
+            else:
+                contract_label.setText("<b>Контракт:</b> — ₽")
+                role_frame._contract_cost = 0
+
+            # Обновление списков актеров откладывается до возврата в цикл событий
+            self._schedule_update()
+
+        # Подключение обработчика выбора актера
+        actor_combo.currentIndexChanged.connect(on_actor_selected)
+
+        # Метки для полей
+        role_label = QLabel(f"Роль {i + 1}:")
+        role_label.setStyleSheet("color: white;")
+        actor_label = QLabel("Актер:")
+        actor_label.setStyleSheet("color: white;")
+
+        # Добавление полей в макет
+        role_layout.addWidget(role_label)
+        role_layout.addWidget(role_name, 2)
+        role_layout.addWidget(actor_label)
+        role_layout.addWidget(actor_combo, 3)
+        role_layout.addWidget(contract_label, 2)
+        role_layout.addWidget(rank_label)
+
+        # Добавление рамки с полями роли в макет
+        self.roles_layout.addWidget(role_frame)
+
+        return role_frame
+
+    def _reset_role_frame(self, role_frame, min_rank):
+        """Сброс полей роли и установка требования к званию."""
+        role_frame._name_edit.clear()
+
+        # Сброс выбора актера без вызова обработчика
+        blocker = QSignalBlocker(role_frame._actor_combo)
+        role_frame._actor_combo.setCurrentIndex(0)
+        role_frame._actor_combo.setModelColumn(RANK_INDEX[min_rank] + 1 if min_rank in RANK_INDEX else 0)
+        blocker.unblock()
+
+        role_frame._contract_label.setText("<b>Контракт:</b> — ₽")
+        role_frame._contract_cost = 0
+
+        # Отображение минимального звания для роли
+        if min_rank in RANK_INDEX:
+            role_frame._rank_label.setText(f"Мин. звание: {min_rank}")
+            role_frame._rank_label.show()
+        else:
+            role_frame._rank_label.hide()
+
+    def _schedule_update(self):
+        """
+        Планирование обновления списков актеров.
+        Несколько изменений выбора подряд приводят к одному обновлению.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self, self._flush_role_update)
+
+    def _flush_role_update(self):
+        """Выполнение запланированного обновления списков актеров."""
+        if self._update_pending:
+            self._do_update_actor_lists()
+
+    def _do_update_actor_lists(self):
+        """Обновление списков актеров для всех ролей."""
+        self._update_pending = False
+
+        # Выпадающие списки актеров всех ролей
+        combos = [role_frame._actor_combo for role_frame in self._role_frames]
+
+        # Сбор занятых актеров в общее множество
+        self._selected_actor_ids.clear()
+        self._selected_actor_ids.update(combo.currentData() for combo in combos)
+        self._selected_actor_ids.discard(None)
+
+        # Сигналы всех списков блокируются до конца фильтрации, чтобы изменения
+        # одного списка не вызывали обработчики остальных
+        blockers = [QSignalBlocker(combo) for combo in combos]
+
+        # Обновление фильтров без пересоздания элементов списков
+        for combo in combos:
+            combo.model().refilter(combo.currentData())
+
+        for blocker in blockers:
+            blocker.unblock()
+
+        # Обновление оставшегося бюджета
+        self.update_remaining_budget()
 
     def update_remaining_budget(self):
-        """Обновление отображения оставшегося бюджета."""
+        """Планирование пересчета оставшегося бюджета."""
+        self._budget_timer.start()
+
+    def _do_update_remaining_budget(self):
+        """Пересчет и отображение оставшегося бюджета."""
+        self._budget_timer.stop()
+
         # Общий бюджет
         total_budget = self.budget_spin.value()
 
         # Сумма контрактов
-        contract_costs = 0
-        for i in range(self.roles_layout.count()):
-            role_frame = self.roles_layout.itemAt(i).widget()
-            if role_frame:
-                cost = role_frame.property("contract_cost")
-                if cost:
-                    contract_costs += cost
+        contract_costs = sum(role_frame._contract_cost for role_frame in self._role_frames)
 
         # Добавление стоимости постановки
         plot_id = self.plot_combo.currentData()
-        plot = next((p for p in self.all_plots if p['plot_id'] == plot_id), None)
+        plot = self._plot_by_id.get(plot_id)
         if plot:
-            contract_costs += plot['production_cost']
+            contract_costs += plot.production_cost
 
         # Расчет оставшегося бюджета
         remaining = total_budget - contract_costs
+        self._remaining_budget = int(remaining)
 
         # Обновление метки с оставшимся бюджетом
-        self.remaining_budget_label.setText(f"{int(remaining):,} ₽".replace(',', ' '))
+        self.remaining_budget_label.setText(format_rub(self._remaining_budget))
 
         # Выделение красным, если бюджет превышен
         if remaining < 0:
@@ -358,7 +478,7 @@ class NewPerformanceDialog(QDialog):
 
         # Получение данных выбранного сюжета
         plot_id = self.plot_combo.currentData()
-        plot = next((p for p in self.all_plots if p['plot_id'] == plot_id), None)
+        plot = self._plot_by_id.get(plot_id)
 
         if not plot:
             QMessageBox.warning(self, "Ошибка", "Выберите сюжет")
@@ -370,61 +490,48 @@ class NewPerformanceDialog(QDialog):
             QMessageBox.warning(self, "Ошибка", "Недостаточно средств в капитале")
             return
 
-        if budget < plot['minimum_budget']:
-            QMessageBox.warning(self, "Ошибка", f"Бюджет должен быть не менее {plot['minimum_budget']:,} ₽")
+        if budget < plot.minimum_budget:
+            QMessageBox.warning(self, "Ошибка", f"Бюджет должен быть не менее {format_rub(plot.minimum_budget)}")
             return
 
+        # Применение отложенных обновлений, чтобы проверить актуальный бюджет
+        self._flush_role_update()
+        self._do_update_remaining_budget()
+
         # Сбор данных о ролях и актерах
         roles_data = []
         assigned_actors = set()
 
-        for i in range(self.roles_layout.count()):
-            role_frame = self.roles_layout.itemAt(i).widget()
-            if role_frame:
-                role_name = None
-                actor_id = None
-                contract_cost = None
-
-                # Получение данных из полей роли
-                for child in role_frame.children():
-                    if isinstance(child, QLineEdit):
-                        role_name = child.text().strip()
-                    elif isinstance(child, QComboBox):
-                        actor_id = child.currentData()
-
-                contract_cost = role_frame.property("contract_cost")
+        for i, role_frame in enumerate(self._role_frames):
+            # Получение данных из полей роли
+            role_name = role_frame._name_edit.text().strip()
+            actor_id = role_frame._actor_combo.currentData()
+            contract_cost = role_frame._contract_cost
 
-                # Проверки заполнения полей
-                if not role_name:
-                    QMessageBox.warning(self, "Ошибка", f"Введите название для роли {i + 1}")
-                    return
+            # Проверки заполнения полей
+            if not role_name:
+                QMessageBox.warning(self, "Ошибка", f"Введите название для роли {i + 1}")
+                return
 
-                if not actor_id:
-                    QMessageBox.warning(self, "Ошибка", f"Выберите актера для роли {i + 1}")
-                    return
+            if not actor_id:
+                QMessageBox.warning(self, "Ошибка", f"Выберите актера для роли {i + 1}")
+                return
 
-                # Проверка дублирования актеров
-                if actor_id in assigned_actors:
-                    QMessageBox.warning(self, "Ошибка", "Один актер не может играть несколько ролей")
-                    return
+            # Проверка дублирования актеров
+            if actor_id in assigned_actors:
+                QMessageBox.warning(self, "Ошибка", "Один актер не может играть несколько ролей")
+                return
 
-                assigned_actors.add(actor_id)
-                roles_data.append((role_name, actor_id, contract_cost))
+            assigned_actors.add(actor_id)
+            roles_data.append((role_name, actor_id, contract_cost))
 
         # Проверка количества ролей
-        if len(roles_data) != plot['roles_count']:
-            QMessageBox.warning(self, "Ошибка", f"Необходимо заполнить все {plot['roles_count']} ролей")
+        if len(roles_data) != plot.roles_count:
+            QMessageBox.warning(self, "Ошибка", f"Необходимо заполнить все {plot.roles_count} ролей")
             return
 
         # Проверка превышения бюджета
-        remaining_budget_text = self.remaining_budget_label.text().replace('₽', '').replace(' ', '').replace(',', '')
-        try:
-            remaining_budget = int(float(remaining_budget_text))
-        except ValueError:
-            QMessageBox.warning(self, "Ошибка", "Некорректное значение оставшегося бюджета")
-            return
-
-        if remaining_budget < 0:
+        if self._remaining_budget < 0:
             QMessageBox.warning(self, "Ошибка", "Превышен бюджет спектакля")
             return
 
@@ -452,23 +559,23 @@ class NewPerformanceDialog(QDialog):
         if success:
             # Форматирование результатов
             profit = result['revenue'] - result['budget']
-            profit_text = f"{profit:,} ₽".replace(',', ' ')
+            profit_text = format_rub(profit)
             profit_color = "green" if profit > 0 else "red"
 
             saved_budget_text = ""
             if result['saved_budget'] > 0:
                 saved_budget_text = (
-                    f"<p><b>Сэкономлено бюджета:</b> {result['saved_budget']:,} ₽ "
-                    f"(возвращено в капитал)</p>".replace(',', ' ')
+                    f"<p><b>Сэкономлено бюджета:</b> {format_rub(result['saved_budget'])} "
+                    f"(возвращено в капитал)</p>"
                 )
 
             # Формирование текста результатов
             result_text = (
                 f"<h2>Результаты спектакля '{self.title_edit.text()}'</h2>"
-                f"<p><b>Изначальный бюджет:</b> {result['original_budget']:,} ₽</p>"
-                f"<p><b>Фактический бюджет:</b> {result['budget']:,} ₽</p>"
+                f"<p><b>Изначальный бюджет:</b> {format_rub(result['original_budget'])}</p>"
+                f"<p><b>Фактический бюджет:</b> {format_rub(result['budget'])}</p>"
                 f"{saved_budget_text}"
-                f"<p><b>Сборы:</b> {result['revenue']:,} ₽</p>"
+                f"<p><b>Сборы:</b> {format_rub(result['revenue'])}</p>"
                 f"<p><b>Прибыль/Убыток:</b> <span style='color:{profit_color}'>{profit_text}</span></p>"
             )
 
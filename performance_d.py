@@ -3,9 +3,10 @@
 """
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
                               QTableWidget, QTableWidgetItem, QHeaderView)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker
+from PySide6.QtGui import QBrush
 
-from controller import TheaterController, NumericTableItem, RankTableItem, CurrencyTableItem
+from controller import TheaterController, NumericTableItem, RankTableItem, CurrencyTableItem, format_rub
 
 
 class PerformanceDetailsDialog(QDialog):
@@ -29,8 +30,8 @@ class PerformanceDetailsDialog(QDialog):
             f"<h2>{performance['title']}</h2>"
             f"<p><b>Год:</b> {performance['year']}</p>"
             f"<p><b>Сюжет:</b> {performance['plot_title']}</p>"
-            f"<p><b>Бюджет:</b> {performance['budget']:,} ₽</p>"
-            f"<p><b>Сборы:</b> {performance['revenue']:,} ₽</p>"
+            f"<p><b>Бюджет:</b> {format_rub(performance['budget'])}</p>"
+            f"<p><b>Сборы:</b> {format_rub(performance['revenue'])}</p>"
         )
         performance_info.setWordWrap(True)
         layout.addWidget(performance_info)
@@ -41,18 +42,18 @@ class PerformanceDetailsDialog(QDialog):
         # Таблица актеров
         actors_table = QTableWidget()
         actors_table.setColumnCount(6)
-        actors_table.setHorizontalHeaderLabels(["ФИО", "Звание", "Опыт", "Награды", "Роль", "Гонорар"])
-        actors_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         actors_table.setRowCount(len(actors))
 
-        # Заполнение таблицы данными
+        # Заполнение таблицы данными без перерисовки и сигналов после каждой ячейки
+        actors_table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(actors_table)
         for i, actor in enumerate(actors):
             name_item = QTableWidgetItem(f"{actor['last_name']} {actor['first_name']} {actor['patronymic']}")
             rank_item = RankTableItem(actor['rank'])
             exp_item = NumericTableItem(str(actor['experience']), actor['experience'])
             awards_item = NumericTableItem(str(actor['awards_count']), actor['awards_count'])
             role_item = QTableWidgetItem(actor['role'])
-            contract_item = CurrencyTableItem(f"{actor['contract_cost']:,} ₽".replace(',', ' '), actor['contract_cost'])
+            contract_item = CurrencyTableItem(format_rub(actor['contract_cost']), actor['contract_cost'])
 
             actors_table.setItem(i, 0, name_item)
             actors_table.setItem(i, 1, rank_item)
@@ -61,6 +62,13 @@ class PerformanceDetailsDialog(QDialog):
             actors_table.setItem(i, 4, role_item)
             actors_table.setItem(i, 5, contract_item)
 
+        blocker.unblock()
+        actors_table.setUpdatesEnabled(True)
+
+        # Заголовки и растягивание столбцов настраиваются после заполнения
+        actors_table.setHorizontalHeaderLabels(["ФИО", "Звание", "Опыт", "Награды", "Роль", "Гонорар"])
+        actors_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
         # Настройка параметров таблицы
         actors_table.setEditTriggers(QTableWidget.NoEditTriggers)
         actors_table.setSortingEnabled(True)
@@ -78,6 +86,10 @@ class PerformanceHistoryDialog(QDialog):
     Диалог для просмотра истории постановок театра.
     Отображает список всех спектаклей с возможностью просмотра подробностей.
     """
+    # Общие кисти для окрашивания прибыли и убытка
+    _PROFIT_BRUSH = QBrush(Qt.green)
+    _LOSS_BRUSH = QBrush(Qt.red)
+
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
@@ -87,6 +99,7 @@ class PerformanceHistoryDialog(QDialog):
         self.setMinimumSize(800, 500)
 
         self.setup_ui()
+        self.reset()
 
     def setup_ui(self):
         """Настройка пользовательского интерфейса диалога."""
@@ -97,69 +110,85 @@ class PerformanceHistoryDialog(QDialog):
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
 
-        # Получение списка постановок
-        self.performances = self.controller.get_performances_history()
+        # Сообщение для случая, когда постановок нет
+        self.empty_label = QLabel("Постановок нет.")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.empty_label)
 
-        if not self.performances:
-            # Если постановок нет, отображаем сообщение
-            empty_label = QLabel("Постановок нет.")
-            empty_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(empty_label)
-        else:
-            # Создание таблицы постановок
-            self.history_table = QTableWidget()
-            self.history_table.setColumnCount(6)
-            self.history_table.setHorizontalHeaderLabels(
-                ["Год", "Название", "Сюжет", "Бюджет", "Сборы", "Прибыль/Убыток"])
-            self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            self.history_table.setRowCount(len(self.performances))
-
-            # Словарь для связи строк таблицы с ID постановок
-            self.row_to_performance_id = {}
-
-            # Заполнение таблицы данными
-            for i, perf in enumerate(self.performances):
-                year_item = NumericTableItem(str(perf['year']), perf['year'])
-                year_item.setData(Qt.UserRole, perf['performance_id'])
-
-                title_item = QTableWidgetItem(perf['title'])
-                plot_item = QTableWidgetItem(perf['plot_title'])
-                budget_item = CurrencyTableItem(f"{perf['budget']:,} ₽".replace(',', ' '), perf['budget'])
-                revenue_item = CurrencyTableItem(f"{perf['revenue']:,} ₽".replace(',', ' '), perf['revenue'])
-
-                # Расчет прибыли/убытка
-                profit = perf['revenue'] - perf['budget']
-                profit_item = CurrencyTableItem(f"{profit:,} ₽".replace(',', ' '), profit)
-
-                # Окрашивание прибыли/убытка в зависимости от результата
-                if profit > 0:
-                    profit_item.setForeground(Qt.green)
-                elif profit < 0:
-                    profit_item.setForeground(Qt.red)
-
-                # Добавление элементов в таблицу
-                self.history_table.setItem(i, 0, year_item)
-                self.history_table.setItem(i, 1, title_item)
-                self.history_table.setItem(i, 2, plot_item)
-                self.history_table.setItem(i, 3, budget_item)
-                self.history_table.setItem(i, 4, revenue_item)
-                self.history_table.setItem(i, 5, profit_item)
-
-                # Сохранение связи строки с ID постановки
-                self.row_to_performance_id[i] = perf['performance_id']
-
-            # Настройка параметров таблицы
-            self.history_table.setSortingEnabled(True)
-            self.history_table.setEditTriggers(QTableWidget.NoEditTriggers)
-            self.history_table.cellDoubleClicked.connect(self.show_performance_details)
-
-            layout.addWidget(self.history_table)
+        # Создание таблицы постановок
+        self.history_table = QTableWidget()
+        self.history_table.setColumnCount(6)
+        self.history_table.setHorizontalHeaderLabels(
+            ["Год", "Название", "Сюжет", "Бюджет", "Сборы", "Прибыль/Убыток"])
+        self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        # Настройка параметров таблицы
+        self.history_table.setSortingEnabled(True)
+        self.history_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.history_table.cellDoubleClicked.connect(self.show_performance_details)
+
+        layout.addWidget(self.history_table)
 
         # Кнопка закрытия
         close_btn = QPushButton("Закрыть")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
 
+    def reset(self):
+        """
+        Заполнение таблицы актуальным списком постановок.
+        Вызывается при создании диалога и перед каждым повторным открытием.
+        """
+        # Получение списка постановок
+        self.performances = self.controller.get_performances_history()
+
+        # Если постановок нет, отображаем сообщение вместо таблицы
+        self.empty_label.setVisible(not self.performances)
+        self.history_table.setVisible(bool(self.performances))
+
+        # Сортировка, перерисовка и сигналы отключаются на время заполнения,
+        # чтобы строки не переставлялись и таблица не обновлялась после каждой ячейки
+        self.history_table.setSortingEnabled(False)
+        self.history_table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.history_table)
+        self.history_table.setRowCount(len(self.performances))
+
+        # Словарь для связи строк таблицы с ID постановок
+        self.row_to_performance_id = {}
+
+        # Заполнение таблицы данными
+        for i, perf in enumerate(self.performances):
+            year_item = NumericTableItem(str(perf['year']), perf['year'])
+            year_item.setData(Qt.UserRole, perf['performance_id'])
+
+            title_item = QTableWidgetItem(perf['title'])
+            plot_item = QTableWidgetItem(perf['plot_title'])
+            budget_item = CurrencyTableItem(format_rub(perf['budget']), perf['budget'])
+            revenue_item = CurrencyTableItem(format_rub(perf['revenue']), perf['revenue'])
+
+            # Расчет прибыли/убытка
+            profit = perf['revenue'] - perf['budget']
+            profit_item = CurrencyTableItem(format_rub(profit), profit)
+
+            # Окрашивание прибыли/убытка в зависимости от результата
+            if profit != 0:
+                profit_item.setForeground(self._PROFIT_BRUSH if profit > 0 else self._LOSS_BRUSH)
+
+            # Добавление элементов в таблицу
+            self.history_table.setItem(i, 0, year_item)
+            self.history_table.setItem(i, 1, title_item)
+            self.history_table.setItem(i, 2, plot_item)
+            self.history_table.setItem(i, 3, budget_item)
+            self.history_table.setItem(i, 4, revenue_item)
+            self.history_table.setItem(i, 5, profit_item)
+
+            # Сохранение связи строки с ID постановки
+            self.row_to_performance_id[i] = perf['performance_id']
+
+        blocker.unblock()
+        self.history_table.setUpdatesEnabled(True)
+        self.history_table.setSortingEnabled(True)
+
     def show_performance_details(self, row, col):
         """Открытие диалога с подробностями о выбранной постановке."""
         # Получение ID постановки из данных ячейки
@@ -6,7 +6,40 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QFormL
                                QTableWidgetItem, QHeaderView, QMessageBox, QLineEdit)
 from PySide6.QtCore import Qt
 
-from controller import TheaterController, NumericTableItem, ValidatedLineEdit
+from controller import TheaterController, NumericTableItem, ValidatedLineEdit, format_rub, RANK_ORDER, RANK_INDEX
+
+
+def _sync_rank_rows(ranks_layout, combo_pool, roles_count, default_ranks=()):
+    """
+    Приведение числа строк выбора званий к количеству ролей.
+    Недостающие строки создаются, лишние скрываются, поэтому изменение
+    количества ролей не пересоздает уже созданные списки.
+
+    Args:
+        ranks_layout: Макет строк выбора званий
+        combo_pool: Список всех созданных комбобоксов, дополняется на месте
+        roles_count: Количество ролей
+        default_ranks: Начальные звания для новых строк
+
+    Returns:
+        list: Комбобоксы для текущего количества ролей
+    """
+    while len(combo_pool) < roles_count:
+        i = len(combo_pool)
+        combo = QComboBox()
+        combo.addItems(RANK_ORDER)
+
+        # Устанавливаем начальное звание, если оно есть
+        if i < len(default_ranks) and default_ranks[i] in RANK_INDEX:
+            combo.setCurrentIndex(RANK_INDEX[default_ranks[i]])
+
+        combo_pool.append(combo)
+        ranks_layout.addRow(QLabel(f"Роль {i + 1}:"), combo)
+
+    for i in range(len(combo_pool)):
+        ranks_layout.setRowVisible(i, i < roles_count)
+
+    return combo_pool[:roles_count]
 
 
 class PlotManagementDialog(QDialog):
@@ -18,7 +51,9 @@ class PlotManagementDialog(QDialog):
     def __init__(self, controller, parent=None):
         super().__init__(parent)
         self.controller = controller
-        self.all_plots = controller.get_all_plots()
+        # Список сюжетов загружается при заполнении таблицы в setup_ui
+        self.all_plots = []
+        self._plot_by_id = {}
 
         self.setWindowTitle("Сюжеты")
         self.setMinimumSize(800, 600)
@@ -72,6 +107,7 @@ class PlotManagementDialog(QDialog):
         """Обновление содержимого таблицы сюжетов."""
         # Получение актуального списка сюжетов
         self.all_plots = self.controller.get_all_plots()
+        self._plot_by_id = {p['plot_id']: p for p in self.all_plots}
         self.plots_table.setRowCount(len(self.all_plots))
 
         # Временно отключаем сортировку для заполнения таблицы
@@ -81,9 +117,9 @@ class PlotManagementDialog(QDialog):
         for i, plot in enumerate(self.all_plots):
             id_item = NumericTableItem(str(plot['plot_id']), plot['plot_id'])
             title_item = QTableWidgetItem(plot['title'])
-            min_budget_item = NumericTableItem(f"{plot['minimum_budget']:,} ₽".replace(',', ' '),
+            min_budget_item = NumericTableItem(format_rub(plot['minimum_budget']),
                                                plot['minimum_budget'])
-            prod_cost_item = NumericTableItem(f"{plot['production_cost']:,} ₽".replace(',', ' '),
+            prod_cost_item = NumericTableItem(format_rub(plot['production_cost']),
                                               plot['production_cost'])
             roles_count_item = NumericTableItem(str(plot['roles_count']), plot['roles_count'])
             demand_item = NumericTableItem(f"{plot['demand']}/10", plot['demand'])
@@ -135,7 +171,7 @@ class PlotManagementDialog(QDialog):
         """Открытие диалога редактирования сюжета."""
         # Получение ID сюжета из таблицы
         plot_id = int(self.plots_table.item(row, 0).text())
-        plot = next((p for p in self.all_plots if p['plot_id'] == plot_id), None)
+        plot = self._plot_by_id.get(plot_id)
 
         if not plot:
             return
@@ -214,6 +250,7 @@ class AddPlotDialog(QDialog):
         self.setMinimumWidth(500)
 
         self.rank_combos = []  # Список комбобоксов для выбора званий
+        self._rank_combo_pool = []  # Все созданные комбобоксы, включая скрытые
         self.setup_ui()
 
     def setup_ui(self):
@@ -295,24 +332,7 @@ class AddPlotDialog(QDialog):
 
     def update_role_ranks(self, roles_count):
         """Обновление полей для выбора минимального звания для каждой роли."""
-        # Очистка существующих полей
-        for i in reversed(range(self.ranks_layout.rowCount())):
-            self.ranks_layout.removeRow(i)
-
-        self.rank_combos = []
-
-        # Добавление комбобоксов для каждой роли
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
-
-        for i in range(roles_count):
-            label = QLabel(f"Роль {i + 1}:")
-            combo = QComboBox()
-
-            for rank in rank_order:
-                combo.addItem(rank)
-
-            self.rank_combos.append(combo)
-            self.ranks_layout.addRow(label, combo)
+        self.rank_combos = _sync_rank_rows(self.ranks_layout, self._rank_combo_pool, roles_count)
 
     def validate_and_accept(self):
         """Валидация введенных данных и закрытие диалога с принятием."""
@@ -344,6 +364,7 @@ class EditPlotDialog(QDialog):
         self.setMinimumWidth(500)
 
         self.rank_combos = []  # Список комбобоксов для выбора званий
+        self._rank_combo_pool = []  # Все созданные комбобоксы, включая скрытые
         self.setup_ui()
 
     def setup_ui(self):
@@ -425,37 +446,9 @@ class EditPlotDialog(QDialog):
 
     def update_role_ranks(self, roles_count):
         """Обновление полей для выбора минимального звания для каждой роли."""
-        # Очистка существующих полей
-        for i in reversed(range(self.ranks_layout.rowCount())):
-            self.ranks_layout.removeRow(i)
-
-        self.rank_combos = []
-
-        # Получаем текущие требуемые звания из сюжета
+        # Текущие требуемые звания сюжета (список уже разобран при загрузке)
         required_ranks = self.plot.get('required_ranks', [])
-        if isinstance(required_ranks, str) and required_ranks.startswith('{') and required_ranks.endswith('}'):
-            required_ranks = required_ranks[1:-1].split(',')
-            required_ranks = [r.strip('"') for r in required_ranks]
-        elif not isinstance(required_ranks, list):
-            required_ranks = ['Начинающий'] * roles_count
-
-        # Добавление комбобоксов для каждой роли
-        rank_order = ['Начинающий', 'Постоянный', 'Ведущий', 'Мастер', 'Заслуженный', 'Народный']
-
-        for i in range(roles_count):
-            label = QLabel(f"Роль {i + 1}:")
-            combo = QComboBox()
-
-            for rank in rank_order:
-                combo.addItem(rank)
-
-            # Устанавливаем текущее звание, если оно есть
-            if i < len(required_ranks) and required_ranks[i] in rank_order:
-                index = rank_order.index(required_ranks[i])
-                combo.setCurrentIndex(index)
-
-            self.rank_combos.append(combo)
-            self.ranks_layout.addRow(label, combo)
+        self.rank_combos = _sync_rank_rows(self.ranks_layout, self._rank_combo_pool, roles_count, required_ranks)
 
     def validate_and_accept(self):
         """Валидация введенных данных и закрытие диалога с принятием."""
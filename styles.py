@@ -0,0 +1,36 @@
+"""
+Модуль стилей приложения "Театральный менеджер".
+Содержит общие шрифты и загрузку единой таблицы стилей, которая устанавливается
+для всего приложения один раз при запуске.
+"""
+import os
+
+from PySide6.QtGui import QFont
+
+
+def _font(point_size, bold=False):
+    """Создание шрифта заданного размера."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+# Шрифты заголовков и информационной панели (создаются один раз при импорте)
+TITLE_FONT_18 = _font(18, bold=True)
+TITLE_FONT_24 = _font(24, bold=True)
+INFO_FONT_14 = _font(14)
+
+# Файл таблицы стилей приложения
+APP_STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.qss")
+
+
+def load_app_stylesheet():
+    """
+    Чтение таблицы стилей приложения из файла app.qss.
+
+    Returns:
+        str: Текст таблицы стилей
+    """
+    with open(APP_STYLESHEET_PATH, encoding="utf-8") as f:
+        return f.read()
@@ -2740,8 +2740,7 @@ class JoinWizardDialog(QDialog):
         cur = self.join_column_combo.currentText()
         self.join_column_combo.blockSignals(True)
         self.join_column_combo.clear()
-        for col in join_columns:
-            self.join_column_combo.addItem(col['name'])
+        self.join_column_combo.addItems([col['name'] for col in join_columns])
         if cur and cur in [c['name'] for c in join_columns]:
             self.join_column_combo.setCurrentText(cur)
         self.join_column_combo.blockSignals(False)